@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import asyncio
 
-from app.api.v1.deps import get_current_user
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.deps import get_current_user, is_uuid
 from app.core.database import get_db
 from app.models.alert import Alert
 from app.models.user import User
@@ -15,24 +18,25 @@ router = APIRouter(prefix="/alerts", tags=["alerts"])
 
 
 @router.get("")
-def list_alerts(user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    alerts = db.query(Alert).filter(Alert.user_id == user.id).all()
-    return {
-        "items": [
-            {
-                "id": alert.id,
-                "symbol": alert.symbol,
-                "target_price": alert.target_price,
-                "above": alert.above,
-                "is_active": alert.is_active,
-            }
-            for alert in alerts
-        ]
-    }
+async def list_alerts(
+    limit: int = Query(default=200, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    result = await db.execute(
+        select(Alert.id, Alert.symbol, Alert.target_price, Alert.above, Alert.is_active)
+        .where(Alert.user_id == user.id)
+        .order_by(Alert.created_at, Alert.id)
+        .offset(offset)
+        .limit(limit)
+    )
+    rows = result.all()
+    return {"items": [row._asdict() for row in rows]}
 
 
 @router.post("")
-def create_alert(payload: CreateAlertRequest, user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def create_alert(payload: CreateAlertRequest, user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
     item = Alert(
         user_id=user.id,
         symbol=payload.symbol.upper(),
@@ -41,8 +45,7 @@ def create_alert(payload: CreateAlertRequest, user: User = Depends(get_current_u
         is_active=True,
     )
     db.add(item)
-    db.commit()
-    db.refresh(item)
+    await db.commit()
     return {
         "id": item.id,
         "symbol": item.symbol,
@@ -53,41 +56,67 @@ def create_alert(payload: CreateAlertRequest, user: User = Depends(get_current_u
 
 
 @router.delete("/{alert_id}")
-def delete_alert(alert_id: str, user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    alert = db.query(Alert).filter(Alert.id == alert_id, Alert.user_id == user.id).first()
+async def delete_alert(alert_id: str, user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    if not is_uuid(alert_id):
+        raise HTTPException(status_code=404, detail="Alert not found")
+    alert = await db.scalar(select(Alert).where(Alert.id == alert_id, Alert.user_id == user.id))
     if not alert:
         raise HTTPException(status_code=404, detail="Alert not found")
-    db.delete(alert)
-    db.commit()
+    await db.delete(alert)
+    await db.commit()
     return {"ok": True}
 
 
 @router.post("/check")
-async def check_alerts(user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    alerts = db.query(Alert).filter(Alert.user_id == user.id, Alert.is_active.is_(True)).all()
-    triggered = []
+async def check_alerts(user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    alerts = (await db.scalars(select(Alert).where(Alert.user_id == user.id, Alert.is_active.is_(True)))).all()
+    if not alerts:
+        return {"triggered": [], "count": 0, "errors": []}
 
+    # One quote per distinct symbol, fetched concurrently; alerts sharing a symbol share the result.
+    symbols = list(dict.fromkeys(alert.symbol for alert in alerts))
+    quotes = await asyncio.gather(*(stock_service.quote(symbol) for symbol in symbols), return_exceptions=True)
+    price_by_symbol = {
+        symbol: (quote.get("price") or 0) if isinstance(quote, dict) else None
+        for symbol, quote in zip(symbols, quotes)
+    }
+    errors = [
+        {"symbol": symbol, "error": str(quote)}
+        for symbol, quote in zip(symbols, quotes)
+        if isinstance(quote, BaseException)
+    ]
+
+    matched = []
     for alert in alerts:
-        quote = await stock_service.quote(alert.symbol)
-        current_price = quote.get("price") or 0
+        current_price = price_by_symbol.get(alert.symbol)
+        if current_price is None:
+            continue
         condition_met = current_price >= alert.target_price if alert.above else current_price <= alert.target_price
-
         if condition_met:
-            email_result = await alert_service.send_alert_email(
-                to_email=user.email,
+            matched.append((alert, current_price))
+
+    to_email = user.email
+    email_results = await asyncio.gather(
+        *(
+            alert_service.send_alert_email(
+                to_email=to_email,
                 symbol=alert.symbol,
                 target_price=alert.target_price,
                 current_price=current_price,
                 above=alert.above,
             )
-            triggered.append(
-                {
-                    "alert_id": alert.id,
-                    "symbol": alert.symbol,
-                    "target_price": alert.target_price,
-                    "current_price": current_price,
-                    "email": email_result,
-                }
-            )
+            for alert, current_price in matched
+        )
+    )
+    triggered = [
+        {
+            "alert_id": alert.id,
+            "symbol": alert.symbol,
+            "target_price": alert.target_price,
+            "current_price": current_price,
+            "email": email_result,
+        }
+        for (alert, current_price), email_result in zip(matched, email_results)
+    ]
 
-    return {"triggered": triggered, "count": len(triggered)}
+    return {"triggered": triggered, "count": len(triggered), "errors": errors}
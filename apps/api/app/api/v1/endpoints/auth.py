@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from google.auth.transport.requests import Request
 from google.oauth2 import id_token
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_user
 from app.core.config import settings
@@ -22,30 +24,34 @@ from app.schemas.auth import (
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# One transport (and its underlying requests.Session/connection pool) for every Google token check.
+_GOOGLE_REQUEST = Request()
+
 
 @router.post("/register", response_model=TokenResponse)
-def register(payload: RegisterRequest, db: Session = Depends(get_db)):
-    existing = db.query(User).filter(User.email == payload.email).first()
+async def register(payload: RegisterRequest, db: AsyncSession = Depends(get_db)):
+    existing = await db.scalar(select(User.id).where(func.lower(User.email) == payload.email.lower()))
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
 
+    # bcrypt is CPU-bound; keep it off the event loop.
+    password_hash = await asyncio.to_thread(get_password_hash, payload.password)
     user = User(
         email=payload.email,
         full_name=payload.full_name,
-        password_hash=get_password_hash(payload.password),
+        password_hash=password_hash,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
 
     token = create_access_token(user.id)
     return TokenResponse(access_token=token)
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == payload.email).first()
-    if not user or not user.password_hash or not verify_password(payload.password, user.password_hash):
+async def login(payload: LoginRequest, db: AsyncSession = Depends(get_db)):
+    user = await db.scalar(select(User).where(func.lower(User.email) == payload.email.lower()))
+    if not user or not user.password_hash or not await asyncio.to_thread(verify_password, payload.password, user.password_hash):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
     token = create_access_token(user.id, expires_delta=timedelta(minutes=settings.access_token_expire_minutes))
@@ -53,12 +59,15 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/google", response_model=TokenResponse)
-def google_sign_in(payload: GoogleLoginRequest, db: Session = Depends(get_db)):
+async def google_sign_in(payload: GoogleLoginRequest, db: AsyncSession = Depends(get_db)):
     if not settings.google_client_id:
         raise HTTPException(status_code=400, detail="Google login not configured")
 
     try:
-        info = id_token.verify_oauth2_token(payload.id_token, Request(), settings.google_client_id)
+        # Signature checks (and the cert fetch) are blocking; run them in a worker thread.
+        info = await asyncio.to_thread(
+            id_token.verify_oauth2_token, payload.id_token, _GOOGLE_REQUEST, settings.google_client_id
+        )
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid Google token")
 
@@ -68,20 +77,21 @@ def google_sign_in(payload: GoogleLoginRequest, db: Session = Depends(get_db)):
     if not sub or not email:
         raise HTTPException(status_code=400, detail="Missing user claims in Google token")
 
-    user = db.query(User).filter((User.google_sub == sub) | (User.email == email)).first()
+    user = await db.scalar(
+        select(User).where((User.google_sub == sub) | (func.lower(User.email) == email.lower())).limit(1)
+    )
     if not user:
         user = User(email=email, full_name=name, google_sub=sub)
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()
     elif not user.google_sub:
         user.google_sub = sub
         db.add(user)
-        db.commit()
+        await db.commit()
 
     return TokenResponse(access_token=create_access_token(user.id))
 
 
 @router.get("/me", response_model=UserResponse)
-def me(user: User = Depends(get_current_user)):
+async def me(user: User = Depends(get_current_user)):
     return UserResponse(id=user.id, email=user.email, full_name=user.full_name)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter
 
 from app.services.stock_service import stock_service
@@ -9,10 +11,13 @@ router = APIRouter(prefix="/compare", tags=["compare"])
 
 @router.get("")
 async def compare(symbols: str):
-    tokens = [item.strip().upper() for item in symbols.split(",") if item.strip()][:4]
+    tokens = list(dict.fromkeys(item.strip().upper() for item in symbols.split(",") if item.strip()))[:4]
+    dashboards = await asyncio.gather(*(stock_service.dashboard(symbol) for symbol in tokens), return_exceptions=True)
     data = []
-    for symbol in tokens:
-        dashboard = await stock_service.dashboard(symbol)
+    for symbol, dashboard in zip(tokens, dashboards):
+        if isinstance(dashboard, BaseException):
+            data.append({"symbol": symbol, "error": str(dashboard)})
+            continue
         ratios = dashboard["ratios"]
         data.append(
             {
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
+from app.core.responses import prebuild_json, static_json_response
 from app.schemas.learning import TutorRequest
 from app.services.ai_service import ai_service
 
@@ -30,11 +31,12 @@ LESSONS = [
         "summary": "Learn how to avoid concentration risk and emotional investing mistakes.",
     },
 ]
+_LESSONS_JSON = prebuild_json({"items": LESSONS})
 
 
 @router.get("/lessons")
-def list_lessons():
-    return {"items": LESSONS}
+def list_lessons(request: Request):
+    return static_json_response(request, _LESSONS_JSON)
 
 
 @router.post("/tutor")
@@ -4,9 +4,13 @@ import asyncio
 from datetime import date
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.api.v1.deps import get_current_user
+from app.api.v1.deps import get_current_user, is_uuid
 from app.core.database import get_db
 from app.models.portfolio import Portfolio, PortfolioPosition, PortfolioTransaction
 from app.models.user import User
@@ -17,47 +21,93 @@ from app.services.stock_service import stock_service
 router = APIRouter(prefix="/portfolios", tags=["portfolios"])
 
 
-def _owned_portfolio_or_404(db: Session, user_id: str, portfolio_id: str) -> Portfolio:
-    portfolio = db.query(Portfolio).filter(Portfolio.id == portfolio_id, Portfolio.user_id == user_id).first()
+async def _owned_portfolio_or_404(db: AsyncSession, user_id: str, portfolio_id: str) -> Portfolio:
+    if not is_uuid(portfolio_id):
+        raise HTTPException(status_code=404, detail="Portfolio not found")
+    portfolio = await db.scalar(
+        select(Portfolio)
+        .options(selectinload(Portfolio.transactions))
+        .where(Portfolio.id == portfolio_id, Portfolio.user_id == user_id)
+    )
     if not portfolio:
         raise HTTPException(status_code=404, detail="Portfolio not found")
     return portfolio
 
 
+async def _assert_portfolio_owned(db: AsyncSession, user_id: str, portfolio_id: str) -> str:
+    if not is_uuid(portfolio_id):
+        raise HTTPException(status_code=404, detail="Portfolio not found")
+    owned_id = await db.scalar(select(Portfolio.id).where(Portfolio.id == portfolio_id, Portfolio.user_id == user_id))
+    if owned_id is None:
+        raise HTTPException(status_code=404, detail="Portfolio not found")
+    return owned_id
+
+
+# Quantity/price columns are Float, so the ORM already hands back floats.
+_POSITION_KEYS = ("id", "symbol", "quantity", "average_buy_price", "sector")
+_TX_KEYS = ("id", "symbol", "side", "quantity", "price", "fee", "trade_date", "note", "created_at")
+
+
 def _serialize_position(position: PortfolioPosition) -> dict:
-    return {
-        "id": position.id,
-        "symbol": position.symbol,
-        "quantity": float(position.quantity),
-        "average_buy_price": float(position.average_buy_price),
-        "sector": position.sector,
-    }
+    return dict(
+        zip(
+            _POSITION_KEYS,
+            (position.id, position.symbol, position.quantity, position.average_buy_price, position.sector),
+        )
+    )
 
 
 def _serialize_transaction(tx: PortfolioTransaction) -> dict:
-    return {
-        "id": tx.id,
-        "symbol": tx.symbol,
-        "side": tx.side,
-        "quantity": float(tx.quantity),
-        "price": float(tx.price),
-        "fee": float(tx.fee),
-        "trade_date": tx.trade_date.isoformat(),
-        "note": tx.note,
-        "created_at": tx.created_at.isoformat() if tx.created_at else "",
-    }
+    created_at = tx.created_at
+    return dict(
+        zip(
+            _TX_KEYS,
+            (
+                tx.id,
+                tx.symbol,
+                tx.side,
+                tx.quantity,
+                tx.price,
+                tx.fee,
+                tx.trade_date.isoformat(),
+                tx.note,
+                created_at.isoformat() if created_at else "",
+            ),
+        )
+    )
 
 
 @router.get("")
-def list_portfolios(user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    portfolios = db.query(Portfolio).filter(Portfolio.user_id == user.id).all()
+async def list_portfolios(
+    limit: int = Query(default=200, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    portfolios = (
+        await db.scalars(
+            select(Portfolio)
+            .where(Portfolio.user_id == user.id)
+            .order_by(Portfolio.created_at, Portfolio.id)
+            .offset(offset)
+            .limit(limit)
+        )
+    ).all()
+    tx_counts: dict[str, int] = {}
+    if portfolios:
+        count_rows = await db.execute(
+            select(PortfolioTransaction.portfolio_id, func.count(PortfolioTransaction.id))
+            .where(PortfolioTransaction.portfolio_id.in_([p.id for p in portfolios]))
+            .group_by(PortfolioTransaction.portfolio_id)
+        )
+        tx_counts = dict(count_rows.all())
     return {
         "items": [
             {
                 "id": p.id,
                 "name": p.name,
                 "positions": [_serialize_position(pos) for pos in p.positions],
-                "transaction_count": len(p.transactions),
+                "transaction_count": tx_counts.get(p.id, 0),
             }
             for p in portfolios
         ]
@@ -65,56 +115,52 @@ def list_portfolios(user: User = Depends(get_current_user), db: Session = Depend
 
 
 @router.post("")
-def create_portfolio(payload: CreatePortfolioRequest, user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def create_portfolio(payload: CreatePortfolioRequest, user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
     portfolio = Portfolio(user_id=user.id, name=payload.name)
     db.add(portfolio)
-    db.commit()
-    db.refresh(portfolio)
+    await db.commit()
     return {"id": portfolio.id, "name": portfolio.name, "positions": []}
 
 
 @router.post("/{portfolio_id}/positions")
-def upsert_position(
+async def upsert_position(
     portfolio_id: str,
     payload: AddPositionRequest,
     user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    portfolio = _owned_portfolio_or_404(db, user.id, portfolio_id)
-
-    symbol = payload.symbol.upper()
-    pos = db.query(PortfolioPosition).filter(
-        PortfolioPosition.portfolio_id == portfolio.id,
-        PortfolioPosition.symbol == symbol,
-    ).first()
-
-    if not pos:
-        pos = PortfolioPosition(
-            portfolio_id=portfolio.id,
-            symbol=symbol,
-            quantity=payload.quantity,
-            average_buy_price=payload.average_buy_price,
-            sector=payload.sector,
-        )
-        db.add(pos)
-    else:
-        pos.quantity = payload.quantity
-        pos.average_buy_price = payload.average_buy_price
-        pos.sector = payload.sector
-
-    db.commit()
-    db.refresh(pos)
-    return _serialize_position(pos)
+    portfolio_id = await _assert_portfolio_owned(db, user.id, portfolio_id)
+
+    # Single round-trip upsert against uq_portfolio_symbol (portfolio_id, symbol).
+    stmt = pg_insert(PortfolioPosition).values(
+        portfolio_id=portfolio_id,
+        symbol=payload.symbol.upper(),
+        quantity=payload.quantity,
+        average_buy_price=payload.average_buy_price,
+        sector=payload.sector,
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_portfolio_symbol",
+        set_={
+            "quantity": stmt.excluded.quantity,
+            "average_buy_price": stmt.excluded.average_buy_price,
+            "sector": stmt.excluded.sector,
+        },
+    ).returning(PortfolioPosition)
+    pos = (await db.scalars(stmt, execution_options={"populate_existing": True})).one()
+    result = _serialize_position(pos)
+    await db.commit()
+    return result
 
 
 @router.post("/{portfolio_id}/transactions")
-def add_transaction(
+async def add_transaction(
     portfolio_id: str,
     payload: AddTransactionRequest,
     user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    portfolio = _owned_portfolio_or_404(db, user.id, portfolio_id)
+    portfolio_id = await _assert_portfolio_owned(db, user.id, portfolio_id)
     symbol = payload.symbol.upper()
     side = payload.side.lower()
     trade_date = payload.trade_date or date.today()
@@ -122,15 +168,17 @@ def add_transaction(
     price = float(payload.price)
     fee = float(payload.fee or 0.0)
 
-    position = db.query(PortfolioPosition).filter(
-        PortfolioPosition.portfolio_id == portfolio.id,
-        PortfolioPosition.symbol == symbol,
-    ).first()
+    position = await db.scalar(
+        select(PortfolioPosition).where(
+            PortfolioPosition.portfolio_id == portfolio_id,
+            PortfolioPosition.symbol == symbol,
+        )
+    )
 
     if side == "buy":
         if not position:
             position = PortfolioPosition(
-                portfolio_id=portfolio.id,
+                portfolio_id=portfolio_id,
                 symbol=symbol,
                 quantity=quantity,
                 average_buy_price=((quantity * price) + fee) / quantity,
@@ -138,28 +186,30 @@ def add_transaction(
             )
             db.add(position)
         else:
-            old_qty = float(position.quantity)
+            old_qty = position.quantity
+            old_avg = position.average_buy_price
             new_qty = old_qty + quantity
-            weighted_cost = (old_qty * float(position.average_buy_price)) + (quantity * price) + fee
+            weighted_cost = (old_qty * old_avg) + (quantity * price) + fee
             position.quantity = new_qty
-            position.average_buy_price = weighted_cost / new_qty if new_qty > 0 else float(position.average_buy_price)
+            position.average_buy_price = weighted_cost / new_qty if new_qty > 0 else old_avg
             if payload.sector:
                 position.sector = payload.sector
     else:
-        if not position or float(position.quantity) <= 0:
+        held = position.quantity if position else 0.0
+        if held <= 0:
             raise HTTPException(status_code=400, detail="Cannot sell: no holding for this symbol.")
-        if float(position.quantity) + 1e-9 < quantity:
+        if held + 1e-9 < quantity:
             raise HTTPException(status_code=400, detail="Cannot sell more than available quantity.")
 
-        remaining = float(position.quantity) - quantity
+        remaining = held - quantity
         if remaining <= 1e-8:
-            db.delete(position)
+            await db.delete(position)
             position = None
         else:
             position.quantity = remaining
 
     tx = PortfolioTransaction(
-        portfolio_id=portfolio.id,
+        portfolio_id=portfolio_id,
         symbol=symbol,
         side=side,
         quantity=quantity,
@@ -169,84 +219,69 @@ def add_transaction(
         note=payload.note,
     )
     db.add(tx)
-    db.commit()
-    db.refresh(tx)
+    await db.commit()
     return _serialize_transaction(tx)
 
 
 @router.get("/{portfolio_id}/transactions")
-def list_transactions(
+async def list_transactions(
     portfolio_id: str,
     limit: int = Query(default=200, ge=1, le=1000),
     user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    portfolio = _owned_portfolio_or_404(db, user.id, portfolio_id)
+    portfolio_id = await _assert_portfolio_owned(db, user.id, portfolio_id)
     rows = (
-        db.query(PortfolioTransaction)
-        .filter(PortfolioTransaction.portfolio_id == portfolio.id)
-        .order_by(PortfolioTransaction.trade_date.desc(), PortfolioTransaction.created_at.desc())
-        .limit(limit)
-        .all()
-    )
+        await db.scalars(
+            select(PortfolioTransaction)
+            .where(PortfolioTransaction.portfolio_id == portfolio_id)
+            .order_by(PortfolioTransaction.trade_date.desc(), PortfolioTransaction.created_at.desc())
+            .limit(limit)
+        )
+    ).all()
     return {"items": [_serialize_transaction(tx) for tx in rows]}
 
 
-@router.get("/{portfolio_id}/insights")
-async def portfolio_insights(portfolio_id: str, user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    portfolio = _owned_portfolio_or_404(db, user.id, portfolio_id)
+async def _benchmark_history() -> list[dict]:
+    try:
+        return await stock_service.history("SPY", period="1y")
+    except Exception:
+        return []
+
+
+@router.get("/{portfolio_id}/insights", response_class=ORJSONResponse)
+async def portfolio_insights(portfolio_id: str, user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    portfolio = await _owned_portfolio_or_404(db, user.id, portfolio_id)
 
     holdings = []
-    tx_rows = (
-        db.query(PortfolioTransaction)
-        .filter(PortfolioTransaction.portfolio_id == portfolio.id)
-        .order_by(PortfolioTransaction.trade_date.asc(), PortfolioTransaction.created_at.asc())
-        .all()
-    )
-    tx_payload = [_serialize_transaction(tx) for tx in tx_rows]
+    tx_rows = portfolio.transactions
 
     symbols = {position.symbol for position in portfolio.positions}
     symbols.update(tx.symbol for tx in tx_rows)
     symbols = {symbol for symbol in symbols if symbol}
 
-    quote_by_symbol: dict[str, dict] = {}
-    profile_by_symbol: dict[str, dict] = {}
-    history_by_symbol: dict[str, list[dict]] = {}
-
-    async def fetch_symbol_bundle(symbol: str):
-        quote, profile, history = await asyncio.gather(
-            stock_service.quote(symbol),
-            stock_service.profile(symbol),
-            stock_service.history(symbol, period="1y"),
-        )
-        return symbol, quote, profile, history
-
-    bundles = await asyncio.gather(*(fetch_symbol_bundle(symbol) for symbol in symbols), return_exceptions=True)
-    for result in bundles:
-        if isinstance(result, Exception):
-            continue
-        sym, quote, profile, history = result
-        try:
-            quote_by_symbol[sym] = quote
-            profile_by_symbol[sym] = profile
-            history_by_symbol[sym] = history
-        except Exception:
-            quote_by_symbol[sym] = {}
-            profile_by_symbol[sym] = {}
-            history_by_symbol[sym] = []
+    symbol_list = list(symbols)
+    quote_by_symbol, profile_by_symbol, history_by_symbol, benchmark_history = await asyncio.gather(
+        stock_service.quotes(symbol_list),
+        stock_service.profiles(symbol_list),
+        stock_service.histories(symbol_list, period="1y"),
+        _benchmark_history(),
+    )
 
     for position in portfolio.positions:
         quote = quote_by_symbol.get(position.symbol, {})
         profile = profile_by_symbol.get(position.symbol, {})
         current_price = float(quote.get("price") or 0.0)
-        value = current_price * float(position.quantity)
-        cost = float(position.average_buy_price) * float(position.quantity)
+        quantity = position.quantity
+        average_buy_price = position.average_buy_price
+        value = current_price * quantity
+        cost = average_buy_price * quantity
         holdings.append(
             {
                 "symbol": position.symbol,
                 "sector": position.sector or profile.get("sector"),
-                "quantity": float(position.quantity),
-                "average_buy_price": float(position.average_buy_price),
+                "quantity": quantity,
+                "average_buy_price": average_buy_price,
                 "current_price": current_price,
                 "market_value": value,
                 "cost_basis": cost,
@@ -256,13 +291,7 @@ async def portfolio_insights(portfolio_id: str, user: User = Depends(get_current
             }
         )
 
-    benchmark_history = []
-    try:
-        benchmark_history = await stock_service.history("SPY", period="1y")
-    except Exception:
-        benchmark_history = []
-
-    insights = portfolio_service.insights(holdings, tx_payload, benchmark_history)
+    insights = portfolio_service.insights(holdings, tx_rows, benchmark_history)
     market_value = insights.get("auto_pnl_calculation", {}).get("market_value", 0.0)
     cost_basis = insights.get("auto_pnl_calculation", {}).get("cost_basis", 0.0)
     unrealized = insights.get("auto_pnl_calculation", {}).get("unrealized_pnl", 0.0)
@@ -287,7 +316,7 @@ async def portfolio_insights(portfolio_id: str, user: User = Depends(get_current
             "cost_basis": round(float(cost_basis or 0), 2),
             "unrealized_pnl": round(float(unrealized or 0), 2),
             "holdings": response_holdings,
-            "transactions": tx_payload[-200:],
+            "transactions": [_serialize_transaction(tx) for tx in tx_rows[-200:]],
         }
     )
     return insights
@@ -1,12 +1,231 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel, Field
 
+from app.core.responses import prebuild_json, static_json_response
 from app.services.screener_service import screener_service
 
 router = APIRouter(prefix="/screener", tags=["screener"])
 
+PRESETS = [
+    {
+        "id": "india-quality-compounders",
+        "label": "India Quality Compounders",
+        "for": "NSE/BSE large caps with healthy ROE, reasonable valuation, and stable quality signals.",
+        "filters": {
+            "market_scope": "india",
+            "min_market_cap": 50000000000,
+            "min_pe": 8,
+            "max_pe": 45,
+            "min_roe": 0.12,
+            "min_revenue_growth": 0.05,
+            "max_debt_to_equity": 1.5,
+            "fcf_positive_5y": True,
+            "min_earnings_consistency": 80,
+        },
+    },
+    {
+        "id": "india-growth-leaders",
+        "label": "India Growth Leaders",
+        "for": "Indian stocks with stronger revenue growth and momentum filters for active watchlists.",
+        "filters": {
+            "market_scope": "india",
+            "min_market_cap": 10000000000,
+            "max_pe": 90,
+            "min_roe": 0.08,
+            "min_revenue_growth": 0.12,
+            "high_momentum_only": True,
+            "min_rsi": 45,
+            "max_rsi": 80,
+        },
+    },
+    {
+        "id": "india-value-income",
+        "label": "India Value & Income",
+        "for": "Indian value screen with debt discipline and dividend-oriented stability.",
+        "filters": {
+            "market_scope": "india",
+            "min_market_cap": 10000000000,
+            "min_pe": 3,
+            "max_pe": 22,
+            "min_roe": 0.08,
+            "max_debt_to_equity": 1.3,
+            "low_volatility_only": True,
+        },
+    },
+    {
+        "id": "quality-compounders",
+        "label": "Quality Compounders",
+        "for": "High quality, consistent compounders with healthy profitability and balance sheets.",
+        "filters": {
+            "market_scope": "us",
+            "min_market_cap": 10000000000,
+            "min_pe": 8,
+            "max_pe": 35,
+            "min_roe": 0.12,
+            "min_revenue_growth": 0.05,
+            "max_debt_to_equity": 1.2,
+            "low_volatility_only": True,
+            "fcf_positive_5y": True,
+            "min_earnings_consistency": 80,
+        },
+    },
+    {
+        "id": "deep-value",
+        "label": "Deep Value",
+        "for": "Low valuation names with acceptable balance-sheet strength and downside control.",
+        "filters": {
+            "market_scope": "us",
+            "min_market_cap": 5000000000,
+            "min_pe": 3,
+            "max_pe": 16,
+            "min_roe": 0.08,
+            "max_debt_to_equity": 1.6,
+            "magic_formula_only": True,
+            "min_sharpe_ratio": 0.3,
+        },
+    },
+    {
+        "id": "high-momentum",
+        "label": "High Momentum",
+        "for": "Trend-following screen focused on strong price leadership and breakouts.",
+        "filters": {
+            "market_scope": "us",
+            "min_market_cap": 2000000000,
+            "min_revenue_growth": 0.08,
+            "high_momentum_only": True,
+            "breakout_only": True,
+            "volume_spike_only": True,
+            "min_rsi": 50,
+            "max_rsi": 78,
+        },
+    },
+    {
+        "id": "turnaround-candidates",
+        "label": "Turnaround Candidates",
+        "for": "Improving businesses where operating leverage and momentum are turning positive.",
+        "filters": {
+            "market_scope": "us",
+            "min_market_cap": 1000000000,
+            "max_pe": 45,
+            "min_roe": 0.03,
+            "min_revenue_growth": 0.02,
+            "operating_leverage_improving": True,
+            "min_rsi": 40,
+        },
+    },
+    {
+        "id": "low-beta-defensive",
+        "label": "Low Beta Defensive",
+        "for": "Lower-volatility and lower-beta companies with stable profitability.",
+        "filters": {
+            "market_scope": "us",
+            "min_market_cap": 10000000000,
+            "max_beta": 0.9,
+            "low_volatility_only": True,
+            "min_roe": 0.08,
+            "max_drawdown_5y_max": 45,
+        },
+    },
+    {
+        "id": "high-fcf-yield",
+        "label": "High FCF Yield",
+        "for": "Cash-generating businesses trading at relatively attractive valuations.",
+        "filters": {
+            "market_scope": "us",
+            "min_market_cap": 3000000000,
+            "max_pe": 28,
+            "min_roe": 0.1,
+            "fcf_positive_5y": True,
+            "debt_decreasing_trend": True,
+        },
+    },
+    {
+        "id": "small-cap-multibagger",
+        "label": "Small Cap Multibagger",
+        "for": "Smaller companies with strong growth and improving quality indicators.",
+        "filters": {
+            "market_scope": "us",
+            "min_market_cap": 300000000,
+            "max_market_cap": 12000000000,
+            "min_revenue_growth": 0.15,
+            "min_revenue_cagr_3y": 0.12,
+            "min_eps_cagr_5y": 0.1,
+            "high_momentum_only": True,
+        },
+    },
+    {
+        "id": "earnings-breakout",
+        "label": "Earnings Breakout",
+        "for": "Revenue and EPS acceleration with improving operating leverage and momentum.",
+        "filters": {
+            "market_scope": "us",
+            "min_market_cap": 2000000000,
+            "min_revenue_growth": 0.1,
+            "min_revenue_cagr_3y": 0.08,
+            "min_eps_cagr_5y": 0.08,
+            "operating_leverage_improving": True,
+            "volume_spike_only": True,
+            "high_momentum_only": True,
+        },
+    },
+    {
+        "id": "high-growth",
+        "label": "High Growth",
+        "for": "High-risk users seeking aggressive growth and strong recent momentum.",
+        "filters": {
+            "market_scope": "us",
+            "min_market_cap": 2000000000,
+            "max_pe": 90,
+            "min_roe": 0.08,
+            "min_revenue_growth": 0.15,
+            "high_momentum_only": True,
+            "breakout_only": True,
+        },
+    },
+    {
+        "id": "dividend-aristocrats",
+        "label": "Dividend Aristocrats (Proxy)",
+        "for": "Income-oriented users",
+        "filters": {
+            "market_scope": "us",
+            "min_market_cap": 10000000000,
+            "min_roe": 0.08,
+            "max_debt_to_equity": 1.4,
+            "dividend_aristocrats_only": True,
+            "low_volatility_only": True,
+        },
+    },
+    {
+        "id": "insider-buying",
+        "label": "Insider Buying",
+        "for": "Signal-driven users",
+        "filters": {
+            "market_scope": "us",
+            "min_market_cap": 2000000000,
+            "min_roe": 0.05,
+            "insider_buying_only": True,
+            "high_momentum_only": True,
+        },
+    },
+    {
+        "id": "volume-breakout",
+        "label": "Volume Breakouts",
+        "for": "Swing setups",
+        "filters": {
+            "market_scope": "us",
+            "breakout_only": True,
+            "volume_spike_only": True,
+            "min_rsi": 45,
+            "max_rsi": 75,
+            "high_momentum_only": True,
+        },
+    },
+]
+PRESETS_BY_ID = {preset["id"]: preset for preset in PRESETS}
+_PRESETS_JSON = prebuild_json({"items": PRESETS})
+
 
 class ScreenerRequest(BaseModel):
     symbols: list[str] = Field(default_factory=list)
@@ -49,228 +268,19 @@ class ScreenerRequest(BaseModel):
 
 @router.post("/run")
 async def run_screener(payload: ScreenerRequest):
-    filters = payload.model_dump()
-    symbols = filters.pop("symbols")
-    result = await screener_service.run(symbols=symbols, filters=filters)
+    filters = payload.model_dump(exclude={"symbols"})
+    result = await screener_service.run(symbols=payload.symbols, filters=filters)
     return result
 
 
 @router.get("/presets")
-def presets():
-    return {
-        "items": [
-            {
-                "id": "india-quality-compounders",
-                "label": "India Quality Compounders",
-                "for": "NSE/BSE large caps with healthy ROE, reasonable valuation, and stable quality signals.",
-                "filters": {
-                    "market_scope": "india",
-                    "min_market_cap": 50000000000,
-                    "min_pe": 8,
-                    "max_pe": 45,
-                    "min_roe": 0.12,
-                    "min_revenue_growth": 0.05,
-                    "max_debt_to_equity": 1.5,
-                    "fcf_positive_5y": True,
-                    "min_earnings_consistency": 80,
-                },
-            },
-            {
-                "id": "india-growth-leaders",
-                "label": "India Growth Leaders",
-                "for": "Indian stocks with stronger revenue growth and momentum filters for active watchlists.",
-                "filters": {
-                    "market_scope": "india",
-                    "min_market_cap": 10000000000,
-                    "max_pe": 90,
-                    "min_roe": 0.08,
-                    "min_revenue_growth": 0.12,
-                    "high_momentum_only": True,
-                    "min_rsi": 45,
-                    "max_rsi": 80,
-                },
-            },
-            {
-                "id": "india-value-income",
-                "label": "India Value & Income",
-                "for": "Indian value screen with debt discipline and dividend-oriented stability.",
-                "filters": {
-                    "market_scope": "india",
-                    "min_market_cap": 10000000000,
-                    "min_pe": 3,
-                    "max_pe": 22,
-                    "min_roe": 0.08,
-                    "max_debt_to_equity": 1.3,
-                    "low_volatility_only": True,
-                },
-            },
-            {
-                "id": "quality-compounders",
-                "label": "Quality Compounders",
-                "for": "High quality, consistent compounders with healthy profitability and balance sheets.",
-                "filters": {
-                    "market_scope": "us",
-                    "min_market_cap": 10000000000,
-                    "min_pe": 8,
-                    "max_pe": 35,
-                    "min_roe": 0.12,
-                    "min_revenue_growth": 0.05,
-                    "max_debt_to_equity": 1.2,
-                    "low_volatility_only": True,
-                    "fcf_positive_5y": True,
-                    "min_earnings_consistency": 80,
-                },
-            },
-            {
-                "id": "deep-value",
-                "label": "Deep Value",
-                "for": "Low valuation names with acceptable balance-sheet strength and downside control.",
-                "filters": {
-                    "market_scope": "us",
-                    "min_market_cap": 5000000000,
-                    "min_pe": 3,
-                    "max_pe": 16,
-                    "min_roe": 0.08,
-                    "max_debt_to_equity": 1.6,
-                    "magic_formula_only": True,
-                    "min_sharpe_ratio": 0.3,
-                },
-            },
-            {
-                "id": "high-momentum",
-                "label": "High Momentum",
-                "for": "Trend-following screen focused on strong price leadership and breakouts.",
-                "filters": {
-                    "market_scope": "us",
-                    "min_market_cap": 2000000000,
-                    "min_revenue_growth": 0.08,
-                    "high_momentum_only": True,
-                    "breakout_only": True,
-                    "volume_spike_only": True,
-                    "min_rsi": 50,
-                    "max_rsi": 78,
-                },
-            },
-            {
-                "id": "turnaround-candidates",
-                "label": "Turnaround Candidates",
-                "for": "Improving businesses where operating leverage and momentum are turning positive.",
-                "filters": {
-                    "market_scope": "us",
-                    "min_market_cap": 1000000000,
-                    "max_pe": 45,
-                    "min_roe": 0.03,
-                    "min_revenue_growth": 0.02,
-                    "operating_leverage_improving": True,
-                    "min_rsi": 40,
-                },
-            },
-            {
-                "id": "low-beta-defensive",
-                "label": "Low Beta Defensive",
-                "for": "Lower-volatility and lower-beta companies with stable profitability.",
-                "filters": {
-                    "market_scope": "us",
-                    "min_market_cap": 10000000000,
-                    "max_beta": 0.9,
-                    "low_volatility_only": True,
-                    "min_roe": 0.08,
-                    "max_drawdown_5y_max": 45,
-                },
-            },
-            {
-                "id": "high-fcf-yield",
-                "label": "High FCF Yield",
-                "for": "Cash-generating businesses trading at relatively attractive valuations.",
-                "filters": {
-                    "market_scope": "us",
-                    "min_market_cap": 3000000000,
-                    "max_pe": 28,
-                    "min_roe": 0.1,
-                    "fcf_positive_5y": True,
-                    "debt_decreasing_trend": True,
-                },
-            },
-            {
-                "id": "small-cap-multibagger",
-                "label": "Small Cap Multibagger",
-                "for": "Smaller companies with strong growth and improving quality indicators.",
-                "filters": {
-                    "market_scope": "us",
-                    "min_market_cap": 300000000,
-                    "max_market_cap": 12000000000,
-                    "min_revenue_growth": 0.15,
-                    "min_revenue_cagr_3y": 0.12,
-                    "min_eps_cagr_5y": 0.1,
-                    "high_momentum_only": True,
-                },
-            },
-            {
-                "id": "earnings-breakout",
-                "label": "Earnings Breakout",
-                "for": "Revenue and EPS acceleration with improving operating leverage and momentum.",
-                "filters": {
-                    "market_scope": "us",
-                    "min_market_cap": 2000000000,
-                    "min_revenue_growth": 0.1,
-                    "min_revenue_cagr_3y": 0.08,
-                    "min_eps_cagr_5y": 0.08,
-                    "operating_leverage_improving": True,
-                    "volume_spike_only": True,
-                    "high_momentum_only": True,
-                },
-            },
-            {
-                "id": "high-growth",
-                "label": "High Growth",
-                "for": "High-risk users seeking aggressive growth and strong recent momentum.",
-                "filters": {
-                    "market_scope": "us",
-                    "min_market_cap": 2000000000,
-                    "max_pe": 90,
-                    "min_roe": 0.08,
-                    "min_revenue_growth": 0.15,
-                    "high_momentum_only": True,
-                    "breakout_only": True,
-                },
-            },
-            {
-                "id": "dividend-aristocrats",
-                "label": "Dividend Aristocrats (Proxy)",
-                "for": "Income-oriented users",
-                "filters": {
-                    "market_scope": "us",
-                    "min_market_cap": 10000000000,
-                    "min_roe": 0.08,
-                    "max_debt_to_equity": 1.4,
-                    "dividend_aristocrats_only": True,
-                    "low_volatility_only": True,
-                },
-            },
-            {
-                "id": "insider-buying",
-                "label": "Insider Buying",
-                "for": "Signal-driven users",
-                "filters": {
-                    "market_scope": "us",
-                    "min_market_cap": 2000000000,
-                    "min_roe": 0.05,
-                    "insider_buying_only": True,
-                    "high_momentum_only": True,
-                },
-            },
-            {
-                "id": "volume-breakout",
-                "label": "Volume Breakouts",
-                "for": "Swing setups",
-                "filters": {
-                    "market_scope": "us",
-                    "breakout_only": True,
-                    "volume_spike_only": True,
-                    "min_rsi": 45,
-                    "max_rsi": 75,
-                    "high_momentum_only": True,
-                },
-            },
-        ]
-    }
+def presets(request: Request):
+    return static_json_response(request, _PRESETS_JSON)
+
+
+@router.get("/presets/{preset_id}")
+def preset(preset_id: str):
+    item = PRESETS_BY_ID.get(preset_id)
+    if item is None:
+        raise HTTPException(status_code=404, detail="Preset not found")
+    return item
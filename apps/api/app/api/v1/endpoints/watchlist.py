@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 
-from app.api.v1.deps import get_current_user
+from app.api.v1.deps import get_current_user, is_uuid
 from app.core.database import get_db
 from app.models.user import User
 from app.models.watchlist import Watchlist, WatchlistItem
@@ -13,9 +18,36 @@ from app.services.stock_service import stock_service
 router = APIRouter(prefix="/watchlists", tags=["watchlists"])
 
 
+async def _owned_watchlist_or_404(db: AsyncSession, user_id: str, watchlist_id: str, with_items: bool = False) -> Watchlist:
+    if not is_uuid(watchlist_id):
+        raise HTTPException(status_code=404, detail="Watchlist not found")
+    stmt = select(Watchlist).where(Watchlist.id == watchlist_id, Watchlist.user_id == user_id)
+    if not with_items:
+        stmt = stmt.options(noload(Watchlist.items))
+    watchlist = await db.scalar(stmt)
+    if not watchlist:
+        raise HTTPException(status_code=404, detail="Watchlist not found")
+    return watchlist
+
+
+async def _assert_watchlist_owned(db: AsyncSession, user_id: str, watchlist_id: str) -> str:
+    if not is_uuid(watchlist_id):
+        raise HTTPException(status_code=404, detail="Watchlist not found")
+    owned_id = await db.scalar(select(Watchlist.id).where(Watchlist.id == watchlist_id, Watchlist.user_id == user_id))
+    if owned_id is None:
+        raise HTTPException(status_code=404, detail="Watchlist not found")
+    return owned_id
+
+
 @router.get("")
-def list_watchlists(user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    watchlists = db.query(Watchlist).filter(Watchlist.user_id == user.id).all()
+async def list_watchlists(user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    watchlists = (
+        await db.scalars(
+            select(Watchlist)
+            .where(Watchlist.user_id == user.id)
+            .order_by(Watchlist.created_at, Watchlist.id)
+        )
+    ).all()
     return {
         "items": [
             {
@@ -29,60 +61,62 @@ def list_watchlists(user: User = Depends(get_current_user), db: Session = Depend
 
 
 @router.post("")
-def create_watchlist(payload: CreateWatchlistRequest, user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def create_watchlist(payload: CreateWatchlistRequest, user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
     watchlist = Watchlist(user_id=user.id, name=payload.name)
     db.add(watchlist)
-    db.commit()
-    db.refresh(watchlist)
+    await db.commit()
     return {"id": watchlist.id, "name": watchlist.name, "items": []}
 
 
 @router.post("/{watchlist_id}/items")
-def add_item(
+async def add_item(
     watchlist_id: str,
     payload: AddWatchlistItemRequest,
     user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    watchlist = db.query(Watchlist).filter(Watchlist.id == watchlist_id, Watchlist.user_id == user.id).first()
-    if not watchlist:
-        raise HTTPException(status_code=404, detail="Watchlist not found")
+    watchlist_id = await _assert_watchlist_owned(db, user.id, watchlist_id)
 
     symbol = payload.symbol.upper()
-    exists = db.query(WatchlistItem).filter(WatchlistItem.watchlist_id == watchlist.id, WatchlistItem.symbol == symbol).first()
-    if exists:
-        return {"id": exists.id, "symbol": exists.symbol}
-
-    item = WatchlistItem(watchlist_id=watchlist.id, symbol=symbol)
-    db.add(item)
-    db.commit()
-    db.refresh(item)
-    return {"id": item.id, "symbol": item.symbol}
+    stmt = (
+        pg_insert(WatchlistItem)
+        .values(watchlist_id=watchlist_id, symbol=symbol)
+        .on_conflict_do_nothing(constraint="uq_watchlist_symbol")
+        .returning(WatchlistItem.id)
+    )
+    item_id = await db.scalar(stmt)
+    await db.commit()
+    if item_id is None:
+        item_id = await db.scalar(
+            select(WatchlistItem.id).where(WatchlistItem.watchlist_id == watchlist_id, WatchlistItem.symbol == symbol)
+        )
+    return {"id": item_id, "symbol": symbol}
 
 
 @router.delete("/{watchlist_id}/items/{item_id}")
-def remove_item(item_id: str, watchlist_id: str, user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    watchlist = db.query(Watchlist).filter(Watchlist.id == watchlist_id, Watchlist.user_id == user.id).first()
-    if not watchlist:
-        raise HTTPException(status_code=404, detail="Watchlist not found")
+async def remove_item(item_id: str, watchlist_id: str, user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    watchlist = await _owned_watchlist_or_404(db, user.id, watchlist_id)
+    if not is_uuid(item_id):
+        raise HTTPException(status_code=404, detail="Watchlist item not found")
 
-    item = db.query(WatchlistItem).filter(WatchlistItem.id == item_id, WatchlistItem.watchlist_id == watchlist.id).first()
+    item = await db.scalar(select(WatchlistItem).where(WatchlistItem.id == item_id, WatchlistItem.watchlist_id == watchlist.id))
     if not item:
         raise HTTPException(status_code=404, detail="Watchlist item not found")
 
-    db.delete(item)
-    db.commit()
+    await db.delete(item)
+    await db.commit()
     return {"ok": True}
 
 
 @router.get("/{watchlist_id}/quotes")
-async def quotes(watchlist_id: str, user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    watchlist = db.query(Watchlist).filter(Watchlist.id == watchlist_id, Watchlist.user_id == user.id).first()
-    if not watchlist:
-        raise HTTPException(status_code=404, detail="Watchlist not found")
-
-    quotes = []
-    for item in watchlist.items:
-        quotes.append(await stock_service.quote(item.symbol))
+async def quotes(watchlist_id: str, user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    watchlist = await _owned_watchlist_or_404(db, user.id, watchlist_id, with_items=True)
+
+    symbols = [item.symbol for item in watchlist.items]
+    results = await asyncio.gather(*(stock_service.quote(symbol) for symbol in symbols), return_exceptions=True)
+    quotes = [
+        {"symbol": symbol, "error": str(result)} if isinstance(result, BaseException) else result
+        for symbol, result in zip(symbols, results)
+    ]
 
     return {"watchlist": watchlist.name, "items": quotes}
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+# Coalesces load(key) calls made within one event-loop tick into a single batch_fn call.
+# batch_fn gets the unique keys and returns {key: value or exception}; missing keys raise KeyError.
+class TickBatcher:
+    def __init__(self, batch_fn: Callable[[list[str]], Awaitable[dict[str, Any]]]) -> None:
+        self._batch_fn = batch_fn
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._scheduled = False
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: str):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._dispatch)
+        return await future
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._scheduled = False
+        task = asyncio.ensure_future(self._run(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending: dict[str, list[asyncio.Future]]) -> None:
+        results: dict[str, Any] = {}
+        try:
+            results = await self._batch_fn(list(pending))
+        except asyncio.CancelledError:
+            # Callers were not cancelled themselves; fail them rather than leave them waiting forever.
+            results = {key: RuntimeError("Batch load was cancelled") for key in pending}
+            raise
+        except Exception as exc:
+            results = {key: exc for key in pending}
+        finally:
+            for key, futures in pending.items():
+                result = results.get(key, KeyError(key))
+                for future in futures:
+                    if future.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
@@ -1,20 +1,53 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
+from typing import Any
+
+import orjson
+import ormsgpack
 
 try:
-    from redis.asyncio import Redis
+    from redis.asyncio import BlockingConnectionPool, Redis
 except Exception:  # pragma: no cover
+    BlockingConnectionPool = None
     Redis = None
 
 from app.core.config import settings
 
 
+# Redis values are msgpack behind a one-byte codec version so the format can be rotated later.
+# Entries without the prefix are JSON written before msgpack and still decode.
+_CODEC_MSGPACK_V1 = b"\x01"
+_MSGPACK_OPTIONS = ormsgpack.OPT_NON_STR_KEYS | ormsgpack.OPT_SERIALIZE_NUMPY
+
+
+def _dumps(value) -> bytes:
+    return _CODEC_MSGPACK_V1 + ormsgpack.packb(value, option=_MSGPACK_OPTIONS)
+
+
+def _loads(raw: bytes):
+    if raw[:1] == _CODEC_MSGPACK_V1:
+        return ormsgpack.unpackb(raw[1:], option=ormsgpack.OPT_NON_STR_KEYS)
+    return orjson.loads(raw)
+
+
+MEMORY_SWEEP_INTERVAL_SECONDS = 30
+
+
+class _LeaderCancelled(Exception):
+    pass
+
+
+# The in-process tier keeps the Python objects themselves; only Redis needs a wire format.
+# Cached payloads are shared between callers and must be treated as read-only.
+# Entries expire per key and the least recently used entry is evicted once max_entries is reached.
 class MemoryTTLCache:
-    def __init__(self) -> None:
-        self._store: dict[str, tuple[float, str]] = {}
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self._store: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._max_entries = max_entries
 
     async def get(self, key: str) -> dict | list | str | None:
         entry = self._store.get(key)
@@ -24,50 +57,136 @@ class MemoryTTLCache:
         if time.time() > expires_at:
             self._store.pop(key, None)
             return None
-        return json.loads(value)
+        self._store.move_to_end(key)
+        return value
 
     async def set(self, key: str, value: dict | list | str, ttl_seconds: int) -> None:
-        self._store[key] = (time.time() + ttl_seconds, json.dumps(value))
+        self._store[key] = (time.time() + ttl_seconds, value)
+        self._store.move_to_end(key)
+        while len(self._store) > self._max_entries:
+            self._store.popitem(last=False)
+
+    def sweep(self) -> None:
+        now = time.time()
+        expired = [key for key, (expires_at, _) in self._store.items() if now > expires_at]
+        for key in expired:
+            self._store.pop(key, None)
 
 
 class CacheClient:
     def __init__(self) -> None:
-        self._memory = MemoryTTLCache()
+        self._memory = MemoryTTLCache(max_entries=settings.memory_cache_max_entries)
         self._redis = None
+        self._redis_pool = None
+        self._sweeper: asyncio.Task | None = None
+        self._refreshing: set[str] = set()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._background: set[asyncio.Task] = set()
+
+    async def _sweep_memory(self) -> None:
+        while True:
+            await asyncio.sleep(MEMORY_SWEEP_INTERVAL_SECONDS)
+            self._memory.sweep()
 
     async def connect(self) -> None:
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep_memory())
         if Redis is None:
             return
+        pool = None
         try:
-            client = Redis.from_url(settings.redis_url, decode_responses=True)
-            await client.ping()
+            # A bounded pool that waits for a free connection instead of opening new ones under bursts.
+            pool = BlockingConnectionPool.from_url(
+                settings.redis_url,
+                max_connections=settings.redis_max_connections,
+                timeout=settings.redis_pool_timeout_seconds,
+                socket_keepalive=True,
+                health_check_interval=30,
+                retry_on_timeout=True,
+            )
+            client = Redis(connection_pool=pool)
+            # A slow or unreachable Redis must not hold up startup; the memory tier covers for it.
+            await asyncio.wait_for(client.ping(), timeout=1.0)
             self._redis = client
+            self._redis_pool = pool
         except Exception:
             self._redis = None
+            if pool is not None:
+                await pool.disconnect()
 
     async def close(self) -> None:
+        if self._sweeper:
+            self._sweeper.cancel()
+            self._sweeper = None
         if self._redis:
             await self._redis.close()
+            self._redis = None
+        if self._redis_pool:
+            await self._redis_pool.disconnect()
+            self._redis_pool = None
 
     async def get(self, key: str):
         if self._redis:
             try:
                 value = await self._redis.get(key)
-                return json.loads(value) if value else None
+                return _loads(value) if value else None
             except Exception:
                 pass
         return await self._memory.get(key)
 
     async def set(self, key: str, value: dict | list | str, ttl_seconds: int = 300) -> None:
-        serialized = json.dumps(value)
         if self._redis:
             try:
-                await self._redis.set(name=key, value=serialized, ex=ttl_seconds)
+                await self._redis.set(name=key, value=_dumps(value), ex=ttl_seconds)
                 return
             except Exception:
                 pass
         await self._memory.set(key, value, ttl_seconds)
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        if not keys:
+            return {}
+        if self._redis:
+            try:
+                values = await self._redis.mget(keys)
+                return {key: _loads(value) for key, value in zip(keys, values) if value}
+            except Exception:
+                pass
+        found = {}
+        for key in keys:
+            value = await self._memory.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set_many(self, values: dict[str, Any], ttl_seconds: int = 300) -> None:
+        if not values:
+            return
+        if self._redis:
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for key, value in values.items():
+                        pipe.set(name=key, value=_dumps(value), ex=ttl_seconds)
+                    await pipe.execute()
+                return
+            except Exception:
+                pass
+        for key, value in values.items():
+            await self._memory.set(key, value, ttl_seconds)
+
+    # Fixed-window counter shared by every worker; None when Redis is unavailable.
+    async def incr_window(self, key: str, window_seconds: int) -> int | None:
+        if not self._redis:
+            return None
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.incr(key)
+                pipe.expire(key, window_seconds)
+                count, _ = await pipe.execute()
+            return int(count)
+        except Exception:
+            return None
+
     async def remember(
         self,
         key: str,
@@ -77,9 +196,94 @@ class CacheClient:
         cached = await self.get(key)
         if cached is not None:
             return cached
-        fresh = await producer()
-        await self.set(key, fresh, ttl_seconds)
-        return fresh
+        return await self._single_flight(key, producer, lambda fresh: self.set(key, fresh, ttl_seconds))
+
+    # Concurrent misses on one key share a single producer run; followers await the leader's result.
+    # A cancelled follower leaves the shared run alone; a cancelled leader wakes followers to retry.
+    async def _single_flight(self, key: str, producer, store):
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                return await asyncio.shield(inflight)
+            except _LeaderCancelled:
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            fresh = await producer()
+            await store(fresh)
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved so a leader-only failure is not logged as unhandled
+            raise
+        else:
+            future.set_result(fresh)
+            return fresh
+        finally:
+            self._inflight.pop(key, None)
+
+    # One MGET for all keys, one producer call for the misses, one pipelined write-back.
+    # The producer returns {key: value} and may omit keys it could not build; those stay uncached.
+    async def remember_many(
+        self,
+        keys: list[str],
+        producer: Callable[[list[str]], Awaitable[dict[str, Any]]],
+        ttl_seconds: int = 300,
+    ) -> dict[str, Any]:
+        found = await self.get_many(keys)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            fresh = await producer(missing)
+            await self.set_many(fresh, ttl_seconds)
+            found.update(fresh)
+        return found
+
+    # Stale-while-revalidate: past fresh_ttl the cached value is still served for up to stale_ttl
+    # while a single background task per key rebuilds it.
+    async def remember_swr(
+        self,
+        key: str,
+        producer: Callable[[], Awaitable[dict | list | str]],
+        fresh_ttl_seconds: int,
+        stale_ttl_seconds: int,
+    ):
+        cached = await self.get(key)
+        if isinstance(cached, dict) and "value" in cached:
+            if time.time() >= (cached.get("fresh_until") or 0):
+                self._schedule_refresh(key, producer, fresh_ttl_seconds, stale_ttl_seconds)
+            return cached["value"]
+        return await self._single_flight(
+            key, producer, lambda fresh: self._store_swr(key, fresh, fresh_ttl_seconds, stale_ttl_seconds)
+        )
+
+    async def _store_swr(self, key: str, value, fresh_ttl_seconds: int, stale_ttl_seconds: int):
+        entry = {"value": value, "fresh_until": time.time() + fresh_ttl_seconds}
+        await self.set(key, entry, fresh_ttl_seconds + stale_ttl_seconds)
+        return value
+
+    def _schedule_refresh(self, key: str, producer, fresh_ttl_seconds: int, stale_ttl_seconds: int) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def refresh() -> None:
+            try:
+                await self._store_swr(key, await producer(), fresh_ttl_seconds, stale_ttl_seconds)
+            except Exception:
+                pass
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.create_task(refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
 
 
 cache = CacheClient()
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import httpx
+
+try:
+    import h2
+except ImportError:  # pragma: no cover - h2 ships with the httpx[http2] extra
+    h2 = None
+
+_client: httpx.AsyncClient | None = None
+
+
+# One pooled client per process, so provider calls reuse keep-alive connections (multiplexed over
+# HTTP/2 when h2 is installed) instead of paying a TCP/TLS handshake per request.
+def get_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=h2 is not None,
+            timeout=20,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=90),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,36 +1,76 @@
 from __future__ import annotations
 
 import time
-from collections import defaultdict, deque
+from collections import OrderedDict, deque
 
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 
+from app.core.cache import cache
+
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, limit: int = 120, window_seconds: int = 60):
+    def __init__(
+        self,
+        app,
+        limit: int = 120,
+        window_seconds: int = 60,
+        max_tracked_clients: int = 10_000,
+        exempt_paths: frozenset[str] = frozenset({"/health"}),
+        trust_forwarded_headers: bool = False,
+    ):
         super().__init__(app)
         self.limit = limit
         self.window_seconds = window_seconds
-        self.requests: dict[str, deque[float]] = defaultdict(deque)
+        self.max_tracked_clients = max_tracked_clients
+        self.exempt_paths = exempt_paths
+        self.trust_forwarded_headers = trust_forwarded_headers
+        # Per-process fallback used only while Redis is unavailable.
+        self.requests: OrderedDict[str, deque[float]] = OrderedDict()
+
+    def _allow_locally(self, ip: str, now: float) -> bool:
+        bucket = self.requests.get(ip)
+        if bucket is None:
+            bucket = self.requests[ip] = deque()
+            while len(self.requests) > self.max_tracked_clients:
+                self.requests.popitem(last=False)
+        else:
+            self.requests.move_to_end(ip)
+
+        while bucket and now - bucket[0] > self.window_seconds:
+            bucket.popleft()
+
+        if len(bucket) >= self.limit:
+            return False
+        bucket.append(now)
+        return True
+
+    def _client_ip(self, request: Request) -> str:
+        # Forwarded headers are client-controlled, so only honour them behind a trusted proxy.
+        if self.trust_forwarded_headers:
+            forwarded = request.headers.get("x-forwarded-for")
+            if forwarded:
+                return forwarded.split(",", 1)[0].strip()
+            real_ip = request.headers.get("x-real-ip")
+            if real_ip:
+                return real_ip.strip()
+        return request.client.host if request.client else "unknown"
 
     async def dispatch(self, request: Request, call_next):
-        if request.url.path.endswith("/health"):
+        if request.scope["path"] in self.exempt_paths:
             return await call_next(request)
 
-        ip = request.client.host if request.client else "unknown"
+        ip = self._client_ip(request)
         now = time.time()
-        bucket = self.requests[ip]
 
-        while bucket and now - bucket[0] > self.window_seconds:
-            bucket.popleft()
+        count = await cache.incr_window(f"rl:{ip}:{int(now // self.window_seconds)}", self.window_seconds)
+        allowed = self._allow_locally(ip, now) if count is None else count <= self.limit
 
-        if len(bucket) >= self.limit:
+        if not allowed:
             return JSONResponse(
                 status_code=429,
                 content={"detail": "Too many requests. Please retry shortly."},
             )
 
-        bucket.append(now)
         return await call_next(request)
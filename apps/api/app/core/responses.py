@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any, NamedTuple
+
+import orjson
+from fastapi import Request, Response
+
+
+class StaticJSON(NamedTuple):
+    body: bytes
+    etag: str
+
+
+def prebuild_json(payload: Any) -> StaticJSON:
+    body = orjson.dumps(payload)
+    return StaticJSON(body=body, etag=f'"{hashlib.md5(body).hexdigest()}"')
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+# Serves a payload encoded once at import time; repeat clients holding the ETag get a bodyless 304.
+def static_json_response(request: Request, static: StaticJSON, max_age_seconds: int = 3600) -> Response:
+    headers = {"ETag": static.etag, "Cache-Control": f"public, max-age={max_age_seconds}"}
+    if _etag_matches(request.headers.get("if-none-match"), static.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=static.body, media_type="application/json", headers=headers)
@@ -3,20 +3,24 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.router import api_router
 from app.core.cache import cache
 from app.core.config import settings
 from app.core.database import Base, engine
+from app.core.http import close_http_client
 from app.core.rate_limit import RateLimitMiddleware
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
     await cache.connect()
     yield
+    await close_http_client()
     await cache.close()
 
 
@@ -25,6 +29,7 @@ app = FastAPI(
     version="1.0.0",
     description="AI-first stock analytics API for beginner and pro users.",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -35,7 +40,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.add_middleware(RateLimitMiddleware, limit=120, window_seconds=60)
+app.add_middleware(
+    RateLimitMiddleware,
+    limit=120,
+    window_seconds=60,
+    trust_forwarded_headers=settings.trust_proxy_headers,
+)
 
 
 @app.get("/health")
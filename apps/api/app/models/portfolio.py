@@ -1,30 +1,30 @@
 from __future__ import annotations
 
-import uuid
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import CheckConstraint, Date, DateTime, Float, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import CheckConstraint, Date, DateTime, Float, ForeignKey, Index, String, UniqueConstraint, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
+from app.core.database import Base, new_id
 
 
 class Portfolio(Base):
     __tablename__ = "portfolios"
+    __table_args__ = (Index("ix_portfolios_user_created", "user_id", "created_at"),)
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[str] = mapped_column(Uuid(as_uuid=False), primary_key=True, default=new_id)
+    user_id: Mapped[str] = mapped_column(Uuid(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     name: Mapped[str] = mapped_column(String(80), nullable=False, default="My Portfolio")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     user = relationship("User", back_populates="portfolios")
-    positions = relationship("PortfolioPosition", back_populates="portfolio", cascade="all,delete-orphan")
+    positions = relationship("PortfolioPosition", back_populates="portfolio", cascade="all,delete-orphan", lazy="selectin")
     transactions = relationship(
         "PortfolioTransaction",
         back_populates="portfolio",
         cascade="all,delete-orphan",
-        order_by="PortfolioTransaction.trade_date.desc()",
+        order_by="(PortfolioTransaction.trade_date, PortfolioTransaction.created_at)",
     )
 
 
@@ -32,8 +32,8 @@ class PortfolioPosition(Base):
     __tablename__ = "portfolio_positions"
     __table_args__ = (UniqueConstraint("portfolio_id", "symbol", name="uq_portfolio_symbol"),)
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    portfolio_id: Mapped[str] = mapped_column(String(36), ForeignKey("portfolios.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[str] = mapped_column(Uuid(as_uuid=False), primary_key=True, default=new_id)
+    portfolio_id: Mapped[str] = mapped_column(Uuid(as_uuid=False), ForeignKey("portfolios.id", ondelete="CASCADE"), nullable=False)
     symbol: Mapped[str] = mapped_column(String(16), nullable=False, index=True)
     quantity: Mapped[float] = mapped_column(Float, nullable=False)
     average_buy_price: Mapped[float] = mapped_column(Float, nullable=False)
@@ -50,8 +50,8 @@ class PortfolioTransaction(Base):
         CheckConstraint("fee >= 0", name="ck_portfolio_tx_fee_non_negative"),
     )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    portfolio_id: Mapped[str] = mapped_column(String(36), ForeignKey("portfolios.id", ondelete="CASCADE"), nullable=False, index=True)
+    id: Mapped[str] = mapped_column(Uuid(as_uuid=False), primary_key=True, default=new_id)
+    portfolio_id: Mapped[str] = mapped_column(Uuid(as_uuid=False), ForeignKey("portfolios.id", ondelete="CASCADE"), nullable=False, index=True)
     symbol: Mapped[str] = mapped_column(String(16), nullable=False, index=True)
     side: Mapped[str] = mapped_column(String(8), nullable=False)  # buy | sell
     quantity: Mapped[float] = mapped_column(Float, nullable=False)
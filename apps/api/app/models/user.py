@@ -1,24 +1,31 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Index, String, Uuid, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
+from app.core.database import Base, new_id
 
 
 class User(Base):
     __tablename__ = "users"
+    # Email/password users have no google_sub; keep their NULLs out of the unique index.
+    __table_args__ = (
+        Index("uq_users_google_sub", "google_sub", unique=True, postgresql_where=text("google_sub IS NOT NULL")),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    id: Mapped[str] = mapped_column(Uuid(as_uuid=False), primary_key=True, default=new_id)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[str] = mapped_column(String(120), nullable=False)
-    password_hash: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    google_sub: Mapped[Optional[str]] = mapped_column(String(255), unique=True, nullable=True)
+    password_hash: Mapped[Optional[str]] = mapped_column(String(72), nullable=True)
+    google_sub: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     watchlists = relationship("Watchlist", back_populates="user", cascade="all,delete-orphan")
     portfolios = relationship("Portfolio", back_populates="user", cascade="all,delete-orphan")
+
+
+# Sign-in matches email case-insensitively, so uniqueness and lookups both go through lower(email).
+Index("uq_users_email_lower", func.lower(User.email), unique=True)
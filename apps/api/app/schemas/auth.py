@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class RegisterRequest(BaseModel):
@@ -19,11 +19,15 @@ class GoogleLoginRequest(BaseModel):
 
 
 class TokenResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     access_token: str
     token_type: str = "bearer"
 
 
 class UserResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     email: EmailStr
     full_name: str
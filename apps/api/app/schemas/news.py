@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class NewsSummaryResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     symbol: str
     bullets: list[str]
     sentiment: str
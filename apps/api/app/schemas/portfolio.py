@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CreatePortfolioRequest(BaseModel):
@@ -29,6 +29,8 @@ class AddTransactionRequest(BaseModel):
 
 
 class PositionResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: str
     symbol: str
     quantity: float
@@ -37,6 +39,8 @@ class PositionResponse(BaseModel):
 
 
 class PortfolioTransactionResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: str
     symbol: str
     side: str
@@ -49,6 +53,8 @@ class PortfolioTransactionResponse(BaseModel):
 
 
 class PortfolioResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: str
     name: str
     positions: list[PositionResponse]
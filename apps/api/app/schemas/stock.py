@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class StockQuote(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     symbol: str
     name: str
     currency: str | None = None
@@ -13,6 +15,8 @@ class StockQuote(BaseModel):
 
 
 class StockProfile(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     symbol: str
     name: str
     sector: str | None = None
@@ -23,6 +27,8 @@ class StockProfile(BaseModel):
 
 
 class StockDashboard(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     quote: StockQuote
     profile: StockProfile
     ratios: dict
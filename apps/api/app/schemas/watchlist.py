@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CreateWatchlistRequest(BaseModel):
@@ -12,11 +12,15 @@ class AddWatchlistItemRequest(BaseModel):
 
 
 class WatchlistItemResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: str
     symbol: str
 
 
 class WatchlistResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: str
     name: str
     items: list[WatchlistItemResponse]
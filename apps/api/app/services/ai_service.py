@@ -1,45 +1,78 @@
 from __future__ import annotations
 
+import hashlib
 import json
+from functools import cached_property, lru_cache
 
-from openai import OpenAI
-
+from app.core.cache import cache
 from app.core.config import settings
 from app.utils.finance_terms import FINANCE_TERM_HINTS
 
+EXPLAIN_METRIC_PROMPT = (
+    "Explain the following stock metric for beginners in plain language. "
+    "Return JSON with keys: title, simple_explanation, analogy, what_good_looks_like, caution, formula, unit. "
+    "Metric: {metric}, Value: {value}, Symbol: {symbol}."
+)
+STOCK_SUMMARY_PROMPT = (
+    "You are an investment education assistant. Return JSON with keys: "
+    "eli15_summary, bull_case, bear_case, risk_level, suitable_for. "
+    "Symbol: {symbol}. Mode: {mode}. Dashboard data: {dashboard}"
+)
+TUTOR_PROMPT = (
+    "Answer this finance-learning question for a beginner. Keep under 140 words and include a real-world analogy. "
+    "Question: {question}"
+)
+
+AI_RESPONSE_TTL_SECONDS = 1800
+
+DEFAULT_METRIC_HINT = {
+    "simple": "This metric helps evaluate business health and valuation.",
+    "analogy": "Think of it as a dashboard signal rather than a single final verdict.",
+    "formula": "Formula varies by metric family.",
+    "unit": "Contextual",
+}
+
+
+@lru_cache(maxsize=256)
+def _metric_key(metric: str) -> str:
+    return metric.lower().replace("/", "_")
+
 
 class AIService:
-    def __init__(self) -> None:
-        self.client = OpenAI(api_key=settings.openai_api_key) if settings.openai_api_key else None
+    @cached_property
+    def client(self):
+        if not settings.openai_api_key:
+            return None
+        from openai import OpenAI
+
+        return OpenAI(api_key=settings.openai_api_key)
+
+    # Model output for a given prompt key is reused across requests and workers for AI_RESPONSE_TTL_SECONDS.
+    async def _complete(self, cache_key: str, prompt: str) -> str:
+        async def produce() -> str:
+            response = self.client.responses.create(model=settings.openai_model, input=prompt)
+            return response.output_text
+
+        return await cache.remember(cache_key, produce, ttl_seconds=AI_RESPONSE_TTL_SECONDS)
 
     async def explain_metric(self, metric: str, value: float | None = None, symbol: str | None = None) -> dict:
-        key = metric.lower().replace("/", "_")
-        hint = FINANCE_TERM_HINTS.get(key)
+        hint = FINANCE_TERM_HINTS.get(_metric_key(metric))
 
         if self.client:
-            prompt = (
-                "Explain the following stock metric for beginners in plain language. "
-                "Return JSON with keys: title, simple_explanation, analogy, what_good_looks_like, caution, formula, unit. "
-                f"Metric: {metric}, Value: {value}, Symbol: {symbol}."
-            )
-            response = self.client.responses.create(model=settings.openai_model, input=prompt)
-            text = response.output_text
+            prompt = EXPLAIN_METRIC_PROMPT.format(metric=metric, value=value, symbol=symbol)
+            value_bucket = "" if value is None else round(value, 2)
+            cache_key = f"ai:explain:{_metric_key(metric)}:{value_bucket}:{(symbol or '').upper()}"
+            text = await self._complete(cache_key, prompt)
             try:
                 return json.loads(text)
             except Exception:
                 pass
 
         if not hint:
-            hint = {
-                "name": metric,
-                "simple": "This metric helps evaluate business health and valuation.",
-                "analogy": "Think of it as a dashboard signal rather than a single final verdict.",
-                "formula": "Formula varies by metric family.",
-                "unit": "Contextual",
-            }
+            hint = DEFAULT_METRIC_HINT
 
         return {
-            "title": hint["name"],
+            "title": hint.get("name", metric),
             "simple_explanation": hint["simple"],
             "analogy": hint["analogy"],
             "what_good_looks_like": "Healthy values depend on industry and trend, not one-time numbers.",
@@ -50,13 +83,8 @@ class AIService:
 
     async def stock_summary(self, symbol: str, dashboard: dict, mode: str = "beginner") -> dict:
         if self.client:
-            prompt = (
-                "You are an investment education assistant. Return JSON with keys: "
-                "eli15_summary, bull_case, bear_case, risk_level, suitable_for. "
-                f"Symbol: {symbol}. Mode: {mode}. Dashboard data: {dashboard}"
-            )
-            response = self.client.responses.create(model=settings.openai_model, input=prompt)
-            text = response.output_text
+            prompt = STOCK_SUMMARY_PROMPT.format(symbol=symbol, mode=mode, dashboard=dashboard)
+            text = await self._complete(f"ai:summary:{symbol.upper()}:{mode}", prompt)
             try:
                 return json.loads(text)
             except Exception:
@@ -90,12 +118,9 @@ class AIService:
 
     async def tutor_answer(self, question: str) -> dict:
         if self.client:
-            prompt = (
-                "Answer this finance-learning question for a beginner. Keep under 140 words and include a real-world analogy. "
-                f"Question: {question}"
-            )
-            response = self.client.responses.create(model=settings.openai_model, input=prompt)
-            return {"answer": response.output_text}
+            prompt = TUTOR_PROMPT.format(question=question)
+            question_key = hashlib.sha1(" ".join(question.lower().split()).encode()).hexdigest()
+            return {"answer": await self._complete(f"ai:tutor:{question_key}", prompt)}
 
         return {
             "answer": (
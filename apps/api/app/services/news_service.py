@@ -1,35 +1,58 @@
 from __future__ import annotations
 
 import asyncio
+import re
 
-import yfinance as yf
-
+from app.core.cache import cache
 from app.core.config import settings
 from app.services.ai_service import ai_service
+from app.utils.lazy_import import lazy_import
+
+yf = lazy_import("yfinance")
+
+POSITIVE_WORDS = frozenset({"beats", "surge", "growth", "strong", "record", "upgrade", "profit"})
+NEGATIVE_WORDS = frozenset({"miss", "fall", "weak", "downgrade", "loss", "lawsuit", "cut"})
+WORD_PATTERN = re.compile(r"[a-z]+")
+BULLET_PREFIX_PATTERN = re.compile(r"^[\s\-*\u2022]+")
+NEWS_SUMMARY_PROMPT = (
+    "Summarize the following stock news into 3-5 concise bullets for a beginner. "
+    "Return plain text bullets only, each line must contain one complete bullet sentence. "
+    "Articles: {articles}"
+)
 
-POSITIVE_WORDS = {"beats", "surge", "growth", "strong", "record", "upgrade", "profit"}
-NEGATIVE_WORDS = {"miss", "fall", "weak", "downgrade", "loss", "lawsuit", "cut"}
+# Shared read-only fallback for missing nested sections; never mutated.
+_EMPTY: dict = {}
+
+NEWS_FRESH_TTL_SECONDS = 900
+NEWS_STALE_TTL_SECONDS = 3600
 
 
 class NewsService:
     def _extract_article(self, item: dict) -> dict:
-        content = item.get("content") or {}
-        provider = content.get("provider") or {}
-        click = content.get("clickThroughUrl") or {}
-        canonical = content.get("canonicalUrl") or {}
-
-        title = item.get("title") or content.get("title") or ""
-        summary = item.get("summary") or content.get("summary") or content.get("description") or ""
+        get_item = item.get
+        content = get_item("content") or _EMPTY
+        get_content = content.get
+        provider = get_content("provider") or _EMPTY
+        click = get_content("clickThroughUrl") or _EMPTY
+        canonical = get_content("canonicalUrl") or _EMPTY
 
         return {
-            "title": title,
-            "publisher": item.get("publisher") or provider.get("displayName"),
-            "link": item.get("link") or click.get("url") or canonical.get("url"),
-            "published": item.get("providerPublishTime") or content.get("pubDate") or content.get("displayTime"),
-            "summary": summary,
+            "title": get_item("title") or get_content("title") or "",
+            "publisher": get_item("publisher") or provider.get("displayName"),
+            "link": get_item("link") or click.get("url") or canonical.get("url"),
+            "published": get_item("providerPublishTime") or get_content("pubDate") or get_content("displayTime"),
+            "summary": get_item("summary") or get_content("summary") or get_content("description") or "",
         }
 
     async def fetch_news(self, symbol: str) -> list[dict]:
+        return await cache.remember_swr(
+            f"news:items:{symbol.upper()}",
+            lambda: self._fetch_news_uncached(symbol),
+            fresh_ttl_seconds=NEWS_FRESH_TTL_SECONDS,
+            stale_ttl_seconds=NEWS_STALE_TTL_SECONDS,
+        )
+
+    async def _fetch_news_uncached(self, symbol: str) -> list[dict]:
         ticker = yf.Ticker(symbol)
         items = await asyncio.to_thread(lambda: ticker.news or [])
         parsed = []
@@ -45,8 +68,11 @@ class NewsService:
         score = 0
         for article in articles:
             text = f"{article.get('title', '')} {article.get('summary', '')}".lower()
-            score += sum(1 for w in POSITIVE_WORDS if w in text)
-            score -= sum(1 for w in NEGATIVE_WORDS if w in text)
+            for token in WORD_PATTERN.findall(text):
+                if token in POSITIVE_WORDS:
+                    score += 1
+                elif token in NEGATIVE_WORDS:
+                    score -= 1
 
         if score > 2:
             return "Positive"
@@ -55,6 +81,14 @@ class NewsService:
         return "Neutral"
 
     async def summarize(self, symbol: str) -> dict:
+        return await cache.remember_swr(
+            f"news:summary:{symbol.upper()}",
+            lambda: self._summarize_uncached(symbol),
+            fresh_ttl_seconds=NEWS_FRESH_TTL_SECONDS,
+            stale_ttl_seconds=NEWS_STALE_TTL_SECONDS,
+        )
+
+    async def _summarize_uncached(self, symbol: str) -> dict:
         news = await self.fetch_news(symbol)
         if not news:
             return {
@@ -68,15 +102,11 @@ class NewsService:
 
         if ai_service.client:
             try:
-                prompt = (
-                    "Summarize the following stock news into 3-5 concise bullets for a beginner. "
-                    "Return plain text bullets only, each line must contain one complete bullet sentence. "
-                    f"Articles: {news}"
-                )
+                prompt = NEWS_SUMMARY_PROMPT.format(articles=news)
                 response = ai_service.client.responses.create(input=prompt, model=settings.openai_model)
                 parsed = []
                 for line in response.output_text.splitlines():
-                    cleaned = line.strip().lstrip("-*• ").strip()
+                    cleaned = BULLET_PREFIX_PATTERN.sub("", line).rstrip()
                     if cleaned:
                         parsed.append(cleaned)
                 bullets = parsed[:5] if parsed else fallback_bullets
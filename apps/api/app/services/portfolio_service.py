@@ -1,10 +1,42 @@
 from __future__ import annotations
 
 import math
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
+from collections.abc import Sequence
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from typing import Any
 
+from app.utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+RISK_METRIC_KEYS = (
+    "annualized_volatility",
+    "annualized_return",
+    "benchmark_annualized_return",
+    "benchmark_annual_vol",
+    "max_drawdown",
+    "beta",
+    "sharpe",
+    "sortino",
+    "calmar",
+    "information_ratio",
+    "upside_capture",
+    "downside_capture",
+    "tracking_error",
+    "alpha",
+)
+
+
+# History and transaction dates repeat heavily across holdings and requests; parse each distinct string once.
+@lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> date | None:
+    try:
+        return datetime.fromisoformat(value).date()
+    except Exception:
+        return None
+
 
 class PortfolioService:
     def _to_number(self, value: Any) -> float | None:
@@ -21,28 +53,28 @@ class PortfolioService:
             return None
         return numerator / denominator
 
-    def _mean(self, values: list[float]) -> float | None:
-        if not values:
-            return None
-        return sum(values) / len(values)
+    @staticmethod
+    def _as_array(values: Sequence[float] | np.ndarray) -> np.ndarray:
+        return np.asarray(values, dtype=np.float64)
 
-    def _std(self, values: list[float]) -> float | None:
-        if len(values) < 2:
+    def _mean(self, values: Sequence[float] | np.ndarray) -> float | None:
+        arr = self._as_array(values)
+        if not arr.size:
             return None
-        mean = self._mean(values)
-        if mean is None:
-            return None
-        variance = sum((value - mean) ** 2 for value in values) / (len(values) - 1)
-        return math.sqrt(variance)
+        return float(arr.mean())
 
-    def _cov(self, x_values: list[float], y_values: list[float]) -> float | None:
-        if len(x_values) != len(y_values) or len(x_values) < 2:
-            return None
-        mean_x = self._mean(x_values)
-        mean_y = self._mean(y_values)
-        if mean_x is None or mean_y is None:
+    def _std(self, values: Sequence[float] | np.ndarray) -> float | None:
+        arr = self._as_array(values)
+        if arr.size < 2:
             return None
-        return sum((x - mean_x) * (y - mean_y) for x, y in zip(x_values, y_values)) / (len(x_values) - 1)
+        return float(arr.std(ddof=1))
+
+    @staticmethod
+    def _field(item: Any, name: str) -> Any:
+        # Transactions arrive either as serialized dicts or as ORM rows.
+        if isinstance(item, dict):
+            return item.get(name)
+        return getattr(item, name, None)
 
     def _to_date(self, value: Any) -> date | None:
         if isinstance(value, date) and not isinstance(value, datetime):
@@ -50,53 +82,83 @@ class PortfolioService:
         if isinstance(value, datetime):
             return value.date()
         if isinstance(value, str):
-            try:
-                return datetime.fromisoformat(value[:10]).date()
-            except Exception:
-                return None
+            return _parse_iso_date(value[:10])
         return None
 
-    def _daily_returns(self, values: list[float]) -> list[float]:
-        returns: list[float] = []
-        for idx in range(1, len(values)):
-            previous = values[idx - 1]
-            current = values[idx]
-            if previous == 0:
-                continue
-            returns.append((current / previous) - 1)
-        return returns
-
-    def _max_drawdown(self, values: list[float]) -> float | None:
-        if len(values) < 2:
+    def _daily_returns(self, values: Sequence[float] | np.ndarray) -> np.ndarray:
+        prices = self._as_array(values)
+        if prices.size < 2:
+            return prices[:0]
+        previous = prices[:-1]
+        current = prices[1:]
+        valid = previous != 0
+        return current[valid] / previous[valid] - 1
+
+    def _max_drawdown(self, values: Sequence[float] | np.ndarray) -> float | None:
+        arr = self._as_array(values)
+        if arr.size < 2:
             return None
-        peak = values[0]
-        worst = 0.0
-        for value in values:
-            if value > peak:
-                peak = value
-            if peak == 0:
-                continue
-            drawdown = (value - peak) / peak
-            if drawdown < worst:
-                worst = drawdown
-        return worst
-
-    def _annualized_return(self, values: list[float], periods_per_year: int = 252) -> float | None:
+        peaks = np.maximum.accumulate(arr)
+        valid = peaks != 0
+        if not valid.any():
+            return 0.0
+        return min(0.0, float(((arr[valid] - peaks[valid]) / peaks[valid]).min()))
+
+    def _log_returns(self, values: Sequence[float] | np.ndarray) -> np.ndarray:
+        prices = self._as_array(values)
+        if prices.size < 2:
+            return prices[:0]
+        previous = prices[:-1]
+        current = prices[1:]
+        valid = (previous > 0) & (current > 0)
+        return np.log(current[valid] / previous[valid])
+
+    def _annualized_return(self, values: Sequence[float] | np.ndarray, periods_per_year: int = 252) -> float | None:
         if len(values) < 2 or values[0] <= 0 or values[-1] <= 0:
             return None
         periods = len(values) - 1
-        if periods <= 0:
-            return None
-        return (values[-1] / values[0]) ** (periods_per_year / periods) - 1
+        # Log returns are additive, so the compounded growth over the window is a single sum.
+        return math.expm1(float(self._log_returns(values).sum()) * periods_per_year / periods)
 
-    def _allocation(self, holdings: list[dict], key: str) -> list[dict]:
-        totals: dict[str, float] = defaultdict(float)
-        portfolio_value = sum(self._to_number(item.get("market_value")) or 0 for item in holdings)
+    def _to_number_array(self, raw: Sequence[Any]) -> np.ndarray:
+        # Bulk counterpart of _to_number: missing and non-finite entries become 0.
+        try:
+            arr = np.fromiter((0.0 if value is None else value for value in raw), dtype=np.float64, count=len(raw))
+        except (TypeError, ValueError, OverflowError):
+            arr = self._as_array([self._to_number(value) or 0 for value in raw])
+        arr[~np.isfinite(arr)] = 0.0
+        return arr
+
+    def _aggregate_holdings(self, holdings: list[dict]) -> dict:
+        # One pass over the holding dicts; everything downstream works on these parallel columns and sums.
+        # Columns: market value, cost basis, pnl; summed together in one reduction.
+        columns = self._to_number_array(
+            [item.get(field) for item in holdings for field in ("market_value", "cost_basis", "pnl")]
+        ).reshape(-1, 3)
+        values = columns[:, 0]
+        market_value, cost_basis, pnl = columns.sum(axis=0).tolist()
+        prices = self._to_number_array([item.get("current_price") for item in holdings])
+        by_symbol: dict[str, float] = defaultdict(float)
+        by_sector: dict[str, float] = defaultdict(float)
+        price_by_symbol: dict[str, float] = {}
+        for item, value, price in zip(holdings, values.tolist(), prices.tolist()):
+            symbol = item.get("symbol")
+            price_by_symbol[str(symbol)] = price
+            by_symbol[str(symbol or "Unknown")] += value
+            by_sector[str(item.get("sector") or "Unknown")] += value
+        return {
+            "values": values,
+            "total": market_value,
+            "cost_basis": cost_basis,
+            "pnl": pnl,
+            "prices": price_by_symbol,
+            "by_symbol": by_symbol,
+            "by_sector": by_sector,
+        }
+
+    def _allocation(self, totals: dict[str, float], portfolio_value: float, key: str) -> list[dict]:
         if portfolio_value <= 0:
             return []
-        for item in holdings:
-            bucket = str(item.get(key) or "Unknown")
-            totals[bucket] += self._to_number(item.get("market_value")) or 0
         rows = []
         for bucket, value in totals.items():
             rows.append(
@@ -109,26 +171,20 @@ class PortfolioService:
         rows.sort(key=lambda row: row["value"], reverse=True)
         return rows
 
-    def diversification_score(self, holdings: list[dict]) -> int:
-        if not holdings:
-            return 0
-
-        total_value = sum(self._to_number(item.get("market_value")) or 0 for item in holdings)
-        if total_value <= 0:
+    def diversification_score(self, values: np.ndarray, sector_totals: dict[str, float], total_value: float) -> int:
+        # A single holding scores 0: no spread across assets and its one sector takes the whole portfolio.
+        if values.size < 2 or total_value <= 0:
             return 0
 
-        asset_weights = [(self._to_number(item.get("market_value")) or 0) / total_value for item in holdings]
-        hhi = sum(weight**2 for weight in asset_weights)
-        n = max(1, len(asset_weights))
-        diversified_component = 0.0 if n == 1 else (1 - hhi) / (1 - (1 / n))
+        weights = values / total_value
+        hhi = float(np.dot(weights, weights))
+        n = values.size
+        diversified_component = max(0, (1 - hhi) / (1 - (1 / n)))
+        if len(sector_totals) < 2:
+            return max(0, min(100, int(diversified_component * 70)))
 
-        sector_weights: dict[str, float] = defaultdict(float)
-        for item in holdings:
-            sector = str(item.get("sector") or "Unknown")
-            sector_weights[sector] += (self._to_number(item.get("market_value")) or 0) / total_value
-
-        top_sector = max(sector_weights.values()) if sector_weights else 1
-        score = int(max(0, diversified_component) * 70 + (1 - top_sector) * 30)
+        top_sector = max(sector_totals.values()) / total_value
+        score = int(diversified_component * 70 + (1 - top_sector) * 30)
         return max(0, min(100, score))
 
     def risk_level(self, annualized_volatility: float | None, max_drawdown: float | None) -> str:
@@ -143,14 +199,16 @@ class PortfolioService:
             return "Medium"
         return "Low"
 
-    def rebalance_suggestions(self, holdings: list[dict], sector_allocation: list[dict]) -> list[str]:
+    def rebalance_suggestions(
+        self, holdings: list[dict], values: np.ndarray, total_value: float, sector_allocation: list[dict]
+    ) -> list[str]:
         if not holdings:
             return ["Add positions and transactions to generate actionable rebalancing guidance."]
 
         suggestions: list[str] = []
-        top_holding = max(holdings, key=lambda item: self._to_number(item.get("market_value")) or 0)
-        total_value = sum(self._to_number(item.get("market_value")) or 0 for item in holdings) or 1
-        top_weight = ((self._to_number(top_holding.get("market_value")) or 0) / total_value) * 100
+        top_index = int(np.argmax(values))
+        top_holding = holdings[top_index]
+        top_weight = (float(values[top_index]) / (total_value or 1)) * 100
 
         if top_weight > 35:
             suggestions.append(f"Trim {top_holding.get('symbol')} exposure below 35% to reduce single-stock concentration.")
@@ -170,91 +228,57 @@ class PortfolioService:
 
         return suggestions
 
-    def _build_series(self, holdings: list[dict], benchmark_history: list[dict]) -> dict:
-        benchmark_points = []
-        for row in benchmark_history or []:
+    def _history_arrays(self, rows: list[dict] | None) -> tuple[np.ndarray, np.ndarray]:
+        # Parse a price history once into parallel (ordinal day, close) arrays, sorted by day.
+        days: list[int] = []
+        closes: list[float] = []
+        for row in rows or []:
             dt = self._to_date(row.get("date"))
             close = self._to_number(row.get("close"))
             if dt and close and close > 0:
-                benchmark_points.append((dt, close))
-
-        benchmark_points.sort(key=lambda item: item[0])
-        if len(benchmark_points) < 30:
+                days.append(dt.toordinal())
+                closes.append(close)
+        day_array = np.asarray(days, dtype=np.int64)
+        order = np.argsort(day_array, kind="stable")
+        return day_array[order], self._as_array(closes)[order]
+
+    def _build_series(
+        self, holdings: list[dict], values: np.ndarray, total_value: float, benchmark_history: list[dict]
+    ) -> dict:
+        bench_days, bench_close = self._history_arrays(benchmark_history)
+        if bench_days.size < 30:
             return {"portfolio": [], "benchmark": [], "dates": []}
 
-        holdings_with_history = []
-        total_value = sum(self._to_number(item.get("market_value")) or 0 for item in holdings)
-        for item in holdings:
-            value = self._to_number(item.get("market_value")) or 0
+        histories = []
+        weights = []
+        for item, value in zip(holdings, values):
             if value <= 0:
                 continue
-            points = []
-            for row in item.get("history") or []:
-                dt = self._to_date(row.get("date"))
-                close = self._to_number(row.get("close"))
-                if dt and close and close > 0:
-                    points.append((dt, close))
-            points.sort(key=lambda point: point[0])
-            if points:
-                holdings_with_history.append(
-                    {
-                        "symbol": item.get("symbol"),
-                        "weight": value / total_value if total_value > 0 else 0,
-                        "points": points,
-                    }
-                )
-
-        if not holdings_with_history:
-            return {"portfolio": [], "benchmark": [], "dates": []}
-
-        benchmark_index_by_date = {dt: close for dt, close in benchmark_points}
-
-        pointers = {item["symbol"]: 0 for item in holdings_with_history}
-        last_close: dict[str, float] = {}
-        base_close: dict[str, float] = {}
-        start_benchmark_close = None
-
-        portfolio_values: list[float] = []
-        benchmark_values: list[float] = []
-        dates: list[str] = []
-
-        for dt, benchmark_close in benchmark_points:
-            for item in holdings_with_history:
-                symbol = item["symbol"]
-                points = item["points"]
-                pointer = pointers[symbol]
-                while pointer < len(points) and points[pointer][0] <= dt:
-                    last_close[symbol] = points[pointer][1]
-                    pointer += 1
-                pointers[symbol] = pointer
-
-            if len(last_close) < len(holdings_with_history):
-                continue
+            history = self._history_arrays(item.get("history"))
+            if history[0].size:
+                histories.append(history)
+                weights.append(value / total_value if total_value > 0 else 0)
 
-            if not base_close:
-                for item in holdings_with_history:
-                    symbol = item["symbol"]
-                    base_close[symbol] = last_close[symbol]
-                start_benchmark_close = benchmark_close
-
-            if not start_benchmark_close or start_benchmark_close <= 0:
-                continue
+        if not histories:
+            return {"portfolio": [], "benchmark": [], "dates": []}
 
-            portfolio_index = 0.0
-            for item in holdings_with_history:
-                symbol = item["symbol"]
-                base = base_close.get(symbol)
-                current = last_close.get(symbol)
-                if not base or not current:
-                    continue
-                portfolio_index += item["weight"] * (current / base)
+        # Forward-fill every holding onto the benchmark calendar as a (dates x holdings) close matrix.
+        closes = np.empty((bench_days.size, len(histories)))
+        first_row = 0
+        for column, (point_days, point_closes) in enumerate(histories):
+            latest = np.searchsorted(point_days, bench_days, side="right") - 1
+            if latest[-1] < 0:
+                return {"portfolio": [], "benchmark": [], "dates": []}
+            closes[:, column] = point_closes[np.maximum(latest, 0)]
+            first_row = max(first_row, int(np.argmax(latest >= 0)))
 
-            benchmark_index = benchmark_index_by_date.get(dt, benchmark_close) / start_benchmark_close
-            dates.append(dt.isoformat())
-            portfolio_values.append(portfolio_index)
-            benchmark_values.append(benchmark_index)
+        portfolio_values = (closes[first_row:] / closes[first_row]) @ self._as_array(weights)
+        # Repeated benchmark dates resolve to the last close seen for that date.
+        last_same_day = np.searchsorted(bench_days, bench_days[first_row:], side="right") - 1
+        benchmark_values = bench_close[last_same_day] / bench_close[first_row]
+        dates = [date.fromordinal(day).isoformat() for day in bench_days[first_row:].tolist()]
 
-        return {"portfolio": portfolio_values, "benchmark": benchmark_values, "dates": dates}
+        return {"portfolio": portfolio_values.tolist(), "benchmark": benchmark_values.tolist(), "dates": dates}
 
     def _xirr(self, cashflows: list[tuple[date, float]]) -> float | None:
         if len(cashflows) < 2:
@@ -266,13 +290,14 @@ class PortfolioService:
 
         cashflows = sorted(cashflows, key=lambda item: item[0])
         start_date = cashflows[0][0]
+        years = self._as_array([(dt - start_date).days for dt, _ in cashflows]) / 365.0
+        amounts = self._as_array([amount for _, amount in cashflows])
 
         def xnpv(rate: float) -> float:
-            total = 0.0
-            for dt, amount in cashflows:
-                years = (dt - start_date).days / 365.0
-                total += amount / ((1 + rate) ** years)
-            return total
+            return float((amounts * (1 + rate) ** -years).sum())
+
+        def xnpv_prime(rate: float) -> float:
+            return float((-years * amounts * (1 + rate) ** (-years - 1)).sum())
 
         low = -0.9999
         high = 4.0
@@ -288,6 +313,22 @@ class PortfolioService:
         if f_low * f_high > 0:
             return None
 
+        # With one sign change in the dated cashflows the NPV has a single root (Descartes' rule), so Newton
+        # inside the bracket lands on the same rate as bisection. Otherwise bisection alone picks the root.
+        signs = np.sign(amounts[amounts != 0])
+        if int((signs[1:] != signs[:-1]).sum()) == 1:
+            rate = 0.1 if low < 0.1 < high else (low + high) / 2
+            for _ in range(20):
+                f_rate = xnpv(rate)
+                if abs(f_rate) < 1e-8:
+                    return rate
+                slope = xnpv_prime(rate)
+                if slope == 0 or not math.isfinite(slope):
+                    break
+                rate -= f_rate / slope
+                if not low < rate < high:
+                    break
+
         for _ in range(120):
             mid = (low + high) / 2
             f_mid = xnpv(mid)
@@ -301,26 +342,37 @@ class PortfolioService:
                 f_low = f_mid
         return (low + high) / 2
 
-    def _tax_gain_calculation(self, transactions: list[dict], holding_prices: dict[str, float]) -> dict:
-        lots_by_symbol: dict[str, list[dict]] = defaultdict(list)
+    def _normalize_transactions(self, transactions: Sequence[Any]) -> list[dict]:
+        # Coerce each transaction once, in trade order, for both the tax lots and the XIRR cashflows.
+        rows = []
+        for tx in transactions:
+            trade_date = self._to_date(self._field(tx, "trade_date"))
+            rows.append(
+                {
+                    "symbol": str(self._field(tx, "symbol") or "").upper(),
+                    "side": str(self._field(tx, "side") or "").lower(),
+                    "quantity": self._to_number(self._field(tx, "quantity")),
+                    "price": self._to_number(self._field(tx, "price")),
+                    "fee": self._to_number(self._field(tx, "fee")) or 0,
+                    "trade_date": trade_date,
+                    "sort_key": (trade_date or date.min, str(self._field(tx, "created_at") or "")),
+                }
+            )
+        rows.sort(key=lambda row: row["sort_key"])
+        return rows
+
+    def _tax_gain_calculation(self, tx_rows: list[dict], holding_prices: dict[str, float]) -> dict:
+        lots_by_symbol: dict[str, deque[dict]] = defaultdict(deque)
         realized_short = 0.0
         realized_long = 0.0
 
-        tx_rows = sorted(
-            transactions,
-            key=lambda item: (
-                self._to_date(item.get("trade_date")) or date.min,
-                str(item.get("created_at") or ""),
-            ),
-        )
-
         for tx in tx_rows:
-            symbol = str(tx.get("symbol") or "").upper()
-            side = str(tx.get("side") or "").lower()
-            quantity = self._to_number(tx.get("quantity")) or 0
-            price = self._to_number(tx.get("price")) or 0
-            fee = self._to_number(tx.get("fee")) or 0
-            trade_date = self._to_date(tx.get("trade_date")) or date.today()
+            symbol = tx["symbol"]
+            side = tx["side"]
+            quantity = tx["quantity"] or 0
+            price = tx["price"] or 0
+            fee = tx["fee"]
+            trade_date = tx["trade_date"] or date.today()
 
             if not symbol or quantity <= 0 or price <= 0:
                 continue
@@ -348,7 +400,7 @@ class PortfolioService:
                 lot["qty"] -= matched
                 remaining -= matched
                 if lot["qty"] <= 1e-9:
-                    lots.pop(0)
+                    lots.popleft()
 
             if remaining > 1e-9:
                 unmatched_gain = remaining * unit_proceeds
@@ -378,20 +430,14 @@ class PortfolioService:
             "estimated_tax_payable": round(estimated_tax, 2),
         }
 
-    def insights(self, holdings: list[dict], transactions: list[dict], benchmark_history: list[dict]) -> dict:
-        market_value = sum(self._to_number(item.get("market_value")) or 0 for item in holdings)
-        cost_basis = sum(self._to_number(item.get("cost_basis")) or 0 for item in holdings)
-        unrealized_pnl = sum(self._to_number(item.get("pnl")) or 0 for item in holdings)
-
-        asset_allocation = self._allocation(holdings, "symbol")
-        sector_allocation = self._allocation(holdings, "sector")
-        diversification = self.diversification_score(holdings)
+    def _risk_metrics(self, portfolio_values: list[float], benchmark_values: list[float]) -> dict:
+        # Without a usable benchmark series every ratio is undefined; skip the returns math entirely.
+        if not portfolio_values:
+            return dict.fromkeys(RISK_METRIC_KEYS)
 
-        series = self._build_series(holdings, benchmark_history)
-        portfolio_values = series["portfolio"]
-        benchmark_values = series["benchmark"]
         portfolio_returns = self._daily_returns(portfolio_values)
         benchmark_returns = self._daily_returns(benchmark_values)
+        paired_returns = portfolio_returns.size > 0 and portfolio_returns.size == benchmark_returns.size
 
         rf_annual = 0.04
         rf_daily = rf_annual / 252
@@ -404,20 +450,20 @@ class PortfolioService:
         max_drawdown = self._max_drawdown(portfolio_values)
 
         beta = None
-        if portfolio_returns and benchmark_returns and len(portfolio_returns) == len(benchmark_returns):
-            covariance = self._cov(portfolio_returns, benchmark_returns)
-            benchmark_variance = self._std(benchmark_returns)
-            if covariance is not None and benchmark_variance is not None and benchmark_variance > 0:
-                beta = covariance / (benchmark_variance**2)
+        if paired_returns and portfolio_returns.size > 1:
+            # One 2x2 covariance matrix gives both cov(portfolio, benchmark) and var(benchmark).
+            covariance = np.cov(portfolio_returns, benchmark_returns, ddof=1)
+            if covariance[1, 1] > 0:
+                beta = float(covariance[0, 1] / covariance[1, 1])
 
         sharpe = None
         if mean_portfolio is not None and std_portfolio and std_portfolio > 0:
             sharpe = ((mean_portfolio - rf_daily) / std_portfolio) * math.sqrt(252)
 
-        downside_diffs = [min(0.0, ret - rf_daily) for ret in portfolio_returns]
+        downside_diffs = np.minimum(0.0, portfolio_returns - rf_daily)
         downside_std = None
-        if downside_diffs and any(diff < 0 for diff in downside_diffs):
-            downside_std = math.sqrt(sum(diff**2 for diff in downside_diffs) / len(downside_diffs))
+        if downside_diffs.size and (downside_diffs < 0).any():
+            downside_std = math.sqrt(float(np.dot(downside_diffs, downside_diffs)) / downside_diffs.size)
 
         sortino = None
         if mean_portfolio is not None and downside_std and downside_std > 0:
@@ -432,40 +478,74 @@ class PortfolioService:
         downside_capture = None
         tracking_error = None
 
-        if portfolio_returns and benchmark_returns and len(portfolio_returns) == len(benchmark_returns):
-            active_returns = [p - b for p, b in zip(portfolio_returns, benchmark_returns)]
+        if paired_returns:
+            active_returns = portfolio_returns - benchmark_returns
             mean_active = self._mean(active_returns)
             std_active = self._std(active_returns)
             if std_active and std_active > 0 and mean_active is not None:
                 information_ratio = (mean_active / std_active) * math.sqrt(252)
                 tracking_error = std_active * math.sqrt(252)
 
-            upside_pairs = [(p, b) for p, b in zip(portfolio_returns, benchmark_returns) if b > 0]
-            downside_pairs = [(p, b) for p, b in zip(portfolio_returns, benchmark_returns) if b < 0]
-
-            if upside_pairs:
-                avg_up_port = self._mean([p for p, _ in upside_pairs]) or 0
-                avg_up_bench = self._mean([b for _, b in upside_pairs]) or 0
+            up_days = benchmark_returns > 0
+            if up_days.any():
+                avg_up_bench = float(benchmark_returns[up_days].mean())
                 if avg_up_bench != 0:
-                    upside_capture = (avg_up_port / avg_up_bench) * 100
+                    upside_capture = (float(portfolio_returns[up_days].mean()) / avg_up_bench) * 100
 
-            if downside_pairs:
-                avg_down_port = self._mean([p for p, _ in downside_pairs]) or 0
-                avg_down_bench = self._mean([b for _, b in downside_pairs]) or 0
+            down_days = benchmark_returns < 0
+            if down_days.any():
+                avg_down_bench = float(benchmark_returns[down_days].mean())
                 if avg_down_bench != 0:
-                    downside_capture = (avg_down_port / avg_down_bench) * 100
+                    downside_capture = (float(portfolio_returns[down_days].mean()) / avg_down_bench) * 100
+
+        benchmark_vol = self._std(benchmark_returns)
+        benchmark_annual_vol = benchmark_vol * math.sqrt(252) if benchmark_vol is not None else None
+
+        alpha = None
+        if annualized_return is not None and benchmark_annualized_return is not None and beta is not None:
+            alpha = annualized_return - (rf_annual + beta * (benchmark_annualized_return - rf_annual))
+
+        return {
+            "annualized_volatility": annualized_volatility,
+            "annualized_return": annualized_return,
+            "benchmark_annualized_return": benchmark_annualized_return,
+            "benchmark_annual_vol": benchmark_annual_vol,
+            "max_drawdown": max_drawdown,
+            "beta": beta,
+            "sharpe": sharpe,
+            "sortino": sortino,
+            "calmar": calmar,
+            "information_ratio": information_ratio,
+            "upside_capture": upside_capture,
+            "downside_capture": downside_capture,
+            "tracking_error": tracking_error,
+            "alpha": alpha,
+        }
+
+    def insights(self, holdings: list[dict], transactions: Sequence[Any], benchmark_history: list[dict]) -> dict:
+        aggregates = self._aggregate_holdings(holdings)
+        market_value = aggregates["total"]
+        cost_basis = aggregates["cost_basis"]
+        unrealized_pnl = aggregates["pnl"]
+
+        asset_allocation = self._allocation(aggregates["by_symbol"], market_value, "symbol")
+        sector_allocation = self._allocation(aggregates["by_sector"], market_value, "sector")
+        diversification = self.diversification_score(aggregates["values"], aggregates["by_sector"], market_value)
 
-        holding_prices = {str(item.get("symbol")): self._to_number(item.get("current_price")) or 0 for item in holdings}
-        tax = self._tax_gain_calculation(transactions, holding_prices)
+        series = self._build_series(holdings, aggregates["values"], market_value, benchmark_history)
+        risk = self._risk_metrics(series["portfolio"], series["benchmark"])
+
+        tx_rows = self._normalize_transactions(transactions)
+        tax = self._tax_gain_calculation(tx_rows, aggregates["prices"])
         realized_pnl = (tax["realized_short_term"] or 0) + (tax["realized_long_term"] or 0)
 
         cashflows: list[tuple[date, float]] = []
-        for tx in transactions:
-            tx_date = self._to_date(tx.get("trade_date"))
-            side = str(tx.get("side") or "").lower()
-            qty = self._to_number(tx.get("quantity"))
-            price = self._to_number(tx.get("price"))
-            fee = self._to_number(tx.get("fee")) or 0
+        for tx in tx_rows:
+            tx_date = tx["trade_date"]
+            side = tx["side"]
+            qty = tx["quantity"]
+            price = tx["price"]
+            fee = tx["fee"]
             if not tx_date or qty is None or price is None:
                 continue
             gross = qty * price
@@ -478,16 +558,9 @@ class PortfolioService:
             cashflows.append((datetime.now(timezone.utc).date(), market_value))
 
         xirr = self._xirr(cashflows)
-        risk_level = self.risk_level(annualized_volatility, max_drawdown)
+        risk_level = self.risk_level(risk["annualized_volatility"], risk["max_drawdown"])
 
-        benchmark_vol = self._std(benchmark_returns)
-        benchmark_annual_vol = benchmark_vol * math.sqrt(252) if benchmark_vol is not None else None
-
-        alpha = None
-        if annualized_return is not None and benchmark_annualized_return is not None and beta is not None:
-            alpha = annualized_return - (rf_annual + beta * (benchmark_annualized_return - rf_annual))
-
-        suggestions = self.rebalance_suggestions(holdings, sector_allocation)
+        suggestions = self.rebalance_suggestions(holdings, aggregates["values"], market_value, sector_allocation)
 
         return {
             "diversification_score": diversification,
@@ -517,24 +590,32 @@ class PortfolioService:
                 }
                 for row in sector_allocation
             ],
-            "beta_of_portfolio": round(beta, 4) if beta is not None else None,
-            "sharpe_ratio": round(sharpe, 4) if sharpe is not None else None,
-            "sortino_ratio": round(sortino, 4) if sortino is not None else None,
-            "calmar_ratio": round(calmar, 4) if calmar is not None else None,
-            "information_ratio": round(information_ratio, 4) if information_ratio is not None else None,
-            "max_drawdown": round(max_drawdown * 100, 2) if max_drawdown is not None else None,
-            "upside_capture": round(upside_capture, 2) if upside_capture is not None else None,
-            "downside_capture": round(downside_capture, 2) if downside_capture is not None else None,
+            "beta_of_portfolio": round(risk["beta"], 4) if risk["beta"] is not None else None,
+            "sharpe_ratio": round(risk["sharpe"], 4) if risk["sharpe"] is not None else None,
+            "sortino_ratio": round(risk["sortino"], 4) if risk["sortino"] is not None else None,
+            "calmar_ratio": round(risk["calmar"], 4) if risk["calmar"] is not None else None,
+            "information_ratio": round(risk["information_ratio"], 4) if risk["information_ratio"] is not None else None,
+            "max_drawdown": round(risk["max_drawdown"] * 100, 2) if risk["max_drawdown"] is not None else None,
+            "upside_capture": round(risk["upside_capture"], 2) if risk["upside_capture"] is not None else None,
+            "downside_capture": round(risk["downside_capture"], 2) if risk["downside_capture"] is not None else None,
             "risk_vs_benchmark_comparison": {
                 "benchmark_symbol": "SPY",
-                "portfolio_annual_return_percent": round((annualized_return or 0) * 100, 2) if annualized_return is not None else None,
-                "benchmark_annual_return_percent": round((benchmark_annualized_return or 0) * 100, 2)
-                if benchmark_annualized_return is not None
+                "portfolio_annual_return_percent": round((risk["annualized_return"] or 0) * 100, 2)
+                if risk["annualized_return"] is not None
+                else None,
+                "benchmark_annual_return_percent": round((risk["benchmark_annualized_return"] or 0) * 100, 2)
+                if risk["benchmark_annualized_return"] is not None
+                else None,
+                "portfolio_annual_volatility_percent": round((risk["annualized_volatility"] or 0) * 100, 2)
+                if risk["annualized_volatility"] is not None
+                else None,
+                "benchmark_annual_volatility_percent": round((risk["benchmark_annual_vol"] or 0) * 100, 2)
+                if risk["benchmark_annual_vol"] is not None
+                else None,
+                "tracking_error_percent": round((risk["tracking_error"] or 0) * 100, 2)
+                if risk["tracking_error"] is not None
                 else None,
-                "portfolio_annual_volatility_percent": round((annualized_volatility or 0) * 100, 2) if annualized_volatility is not None else None,
-                "benchmark_annual_volatility_percent": round((benchmark_annual_vol or 0) * 100, 2) if benchmark_annual_vol is not None else None,
-                "tracking_error_percent": round((tracking_error or 0) * 100, 2) if tracking_error is not None else None,
-                "alpha_percent": round((alpha or 0) * 100, 2) if alpha is not None else None,
+                "alpha_percent": round((risk["alpha"] or 0) * 100, 2) if risk["alpha"] is not None else None,
             },
             "tax_gain_calculation": tax,
         }
@@ -1,30 +1,34 @@
 from __future__ import annotations
 
-import httpx
+import heapq
+
+import orjson
 
 from app.core.config import settings
+from app.core.http import get_http_client
 from app.services.providers.base import StockProvider
 
+ALPHA_VANTAGE_URL = "https://www.alphavantage.co/query"
+
 
 class AlphaVantageProvider(StockProvider):
     name = "alpha_vantage"
+    max_concurrency = 5
 
     def _ready(self) -> bool:
         return bool(settings.alpha_vantage_api_key)
 
+    async def _query(self, function: str, **params) -> dict:
+        params = {"function": function, **params, "apikey": settings.alpha_vantage_api_key}
+        async with self._request_slot():
+            response = await get_http_client().get(ALPHA_VANTAGE_URL, params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     async def get_quote(self, symbol: str) -> dict:
         if not self._ready():
             raise RuntimeError("Alpha Vantage API key missing")
-        url = "https://www.alphavantage.co/query"
-        params = {
-            "function": "GLOBAL_QUOTE",
-            "symbol": symbol,
-            "apikey": settings.alpha_vantage_api_key,
-        }
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json().get("Global Quote", {})
+        data = (await self._query("GLOBAL_QUOTE", symbol=symbol)).get("Global Quote", {})
 
         if not data:
             raise RuntimeError("No quote returned")
@@ -46,16 +50,7 @@ class AlphaVantageProvider(StockProvider):
     async def get_profile(self, symbol: str) -> dict:
         if not self._ready():
             raise RuntimeError("Alpha Vantage API key missing")
-        url = "https://www.alphavantage.co/query"
-        params = {
-            "function": "OVERVIEW",
-            "symbol": symbol,
-            "apikey": settings.alpha_vantage_api_key,
-        }
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        data = await self._query("OVERVIEW", symbol=symbol)
 
         if not data or "Symbol" not in data:
             raise RuntimeError("No profile returned")
@@ -95,22 +90,12 @@ class AlphaVantageProvider(StockProvider):
     async def get_history(self, symbol: str, period: str = "6mo") -> list[dict]:
         if not self._ready():
             raise RuntimeError("Alpha Vantage API key missing")
-        url = "https://www.alphavantage.co/query"
-        params = {
-            "function": "TIME_SERIES_DAILY",
-            "symbol": symbol,
-            "outputsize": "compact",
-            "apikey": settings.alpha_vantage_api_key,
-        }
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json().get("Time Series (Daily)", {})
+        data = (await self._query("TIME_SERIES_DAILY", symbol=symbol, outputsize="compact")).get("Time Series (Daily)", {})
 
         if not data:
             raise RuntimeError("No historical data returned")
 
-        ordered_dates = sorted(data.keys())[-120:]
+        ordered_dates = sorted(heapq.nlargest(120, data))
         return [
             {
                 "date": dt,
@@ -127,16 +112,7 @@ class AlphaVantageProvider(StockProvider):
     async def search(self, query: str) -> list[dict]:
         if not self._ready():
             return []
-        url = "https://www.alphavantage.co/query"
-        params = {
-            "function": "SYMBOL_SEARCH",
-            "keywords": query,
-            "apikey": settings.alpha_vantage_api_key,
-        }
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json().get("bestMatches", [])
+        data = (await self._query("SYMBOL_SEARCH", keywords=query)).get("bestMatches", [])
 
         return [
             {
@@ -149,5 +125,14 @@ class AlphaVantageProvider(StockProvider):
             if item.get("1. symbol")
         ]
 
+    async def get_earnings_transcript(self, symbol: str, quarter: str) -> str:
+        if not self._ready():
+            return ""
+        data = await self._query("EARNINGS_CALL_TRANSCRIPT", symbol=symbol.upper(), quarter=quarter)
+        transcript = data.get("transcript") if isinstance(data, dict) else None
+        if isinstance(transcript, str) and transcript.strip():
+            return transcript.strip()
+        return ""
+
     async def get_financials(self, symbol: str, years: int = 10) -> dict:
         raise RuntimeError("Alpha Vantage financial statements endpoint not enabled in this implementation")
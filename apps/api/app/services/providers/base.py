@@ -1,15 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 
 
 class StockProvider(ABC):
     name: str
+    # Upper bound on in-flight upstream requests per process for this provider, sized to its free-tier
+    # rate limit. The semaphore is built lazily per class and per running loop: one created at import
+    # time binds to whatever loop exists then on Python < 3.10.
+    max_concurrency: int = 10
+    _limiter: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+
+    @classmethod
+    def _request_slot(cls) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        limiter = cls.__dict__.get("_limiter")
+        if limiter is None or limiter[0] is not loop:
+            limiter = (loop, asyncio.Semaphore(cls.max_concurrency))
+            cls._limiter = limiter
+        return limiter[1]
 
     @abstractmethod
     async def get_quote(self, symbol: str) -> dict:
         raise NotImplementedError
 
+    # Providers with a multi-symbol endpoint override this; values are quotes or the per-symbol error.
+    async def get_quotes(self, symbols: list[str]) -> dict[str, dict | BaseException]:
+        results = await asyncio.gather(*(self.get_quote(symbol) for symbol in symbols), return_exceptions=True)
+        return dict(zip(symbols, results))
+
     @abstractmethod
     async def get_profile(self, symbol: str) -> dict:
         raise NotImplementedError
@@ -1,17 +1,31 @@
 from __future__ import annotations
 
-import httpx
+import asyncio
+
+import orjson
 
 from app.core.config import settings
+from app.core.http import get_http_client
 from app.services.providers.base import StockProvider
 
+FMP_BASE_URL = "https://financialmodelingprep.com/api/v3"
+QUOTE_BATCH_SIZE = 100
+
 
 class FMPProvider(StockProvider):
     name = "fmp"
+    max_concurrency = 20
 
     def _ready(self) -> bool:
         return bool(settings.fmp_api_key)
 
+    async def _get(self, path: str, **params):
+        params["apikey"] = settings.fmp_api_key
+        async with self._request_slot():
+            response = await get_http_client().get(f"{FMP_BASE_URL}/{path}", params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     @staticmethod
     def _parse_range(raw_value):
         if not raw_value or not isinstance(raw_value, str) or "-" not in raw_value:
@@ -22,19 +36,8 @@ class FMPProvider(StockProvider):
         except Exception:
             return (None, None)
 
-    async def get_quote(self, symbol: str) -> dict:
-        if not self._ready():
-            raise RuntimeError("FMP API key missing")
-        url = f"https://financialmodelingprep.com/api/v3/quote/{symbol}"
-        params = {"apikey": settings.fmp_api_key}
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            payload = response.json()
-
-        if not payload:
-            raise RuntimeError("No quote returned")
-        row = payload[0]
+    @staticmethod
+    def _quote_from_row(row: dict, symbol: str) -> dict:
         return {
             "symbol": row.get("symbol", symbol.upper()),
             "name": row.get("name") or symbol.upper(),
@@ -49,15 +52,41 @@ class FMPProvider(StockProvider):
             "close": row.get("previousClose") or row.get("price"),
         }
 
+    async def get_quote(self, symbol: str) -> dict:
+        if not self._ready():
+            raise RuntimeError("FMP API key missing")
+        payload = await self._get(f"quote/{symbol}")
+
+        if not payload:
+            raise RuntimeError("No quote returned")
+        return self._quote_from_row(payload[0], symbol)
+
+    async def _quote_rows(self, symbols: list[str]) -> dict[str, dict]:
+        payload = await self._get(f"quote/{','.join(symbols)}")
+        return {str(row.get("symbol") or "").upper(): row for row in payload or [] if isinstance(row, dict)}
+
+    async def get_quotes(self, symbols: list[str]) -> dict[str, dict | BaseException]:
+        if not self._ready():
+            raise RuntimeError("FMP API key missing")
+        # Large batches are split so the comma-separated path stays within the endpoint's symbol limit.
+        chunks = [symbols[start : start + QUOTE_BATCH_SIZE] for start in range(0, len(symbols), QUOTE_BATCH_SIZE)]
+        chunk_rows = await asyncio.gather(*(self._quote_rows(chunk) for chunk in chunks), return_exceptions=True)
+
+        results: dict[str, dict | BaseException] = {}
+        for chunk, rows in zip(chunks, chunk_rows):
+            for symbol in chunk:
+                if isinstance(rows, BaseException):
+                    results[symbol] = rows
+                elif symbol.upper() in rows:
+                    results[symbol] = self._quote_from_row(rows[symbol.upper()], symbol)
+                else:
+                    results[symbol] = RuntimeError("No quote returned")
+        return results
+
     async def get_profile(self, symbol: str) -> dict:
         if not self._ready():
             raise RuntimeError("FMP API key missing")
-        url = f"https://financialmodelingprep.com/api/v3/profile/{symbol}"
-        params = {"apikey": settings.fmp_api_key}
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            payload = response.json()
+        payload = await self._get(f"profile/{symbol}")
 
         if not payload:
             raise RuntimeError("No profile returned")
@@ -98,12 +127,7 @@ class FMPProvider(StockProvider):
     async def get_history(self, symbol: str, period: str = "6mo") -> list[dict]:
         if not self._ready():
             raise RuntimeError("FMP API key missing")
-        url = f"https://financialmodelingprep.com/api/v3/historical-price-full/{symbol}"
-        params = {"timeseries": 120, "apikey": settings.fmp_api_key}
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            payload = response.json().get("historical", [])
+        payload = (await self._get(f"historical-price-full/{symbol}", timeseries=120)).get("historical", [])
 
         if not payload:
             raise RuntimeError("No historical data returned")
@@ -125,12 +149,7 @@ class FMPProvider(StockProvider):
     async def search(self, query: str) -> list[dict]:
         if not self._ready():
             return []
-        url = "https://financialmodelingprep.com/api/v3/search"
-        params = {"query": query, "limit": 8, "exchange": "NASDAQ", "apikey": settings.fmp_api_key}
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            payload = response.json()
+        payload = await self._get("search", query=query, limit=8, exchange="NASDAQ")
 
         return [
             {
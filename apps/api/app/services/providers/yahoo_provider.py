@@ -4,9 +4,14 @@ import asyncio
 import math
 from datetime import date, datetime
 
-import yfinance as yf
-
 from app.services.providers.base import StockProvider
+from app.utils.lazy_import import lazy_import
+
+yf = lazy_import("yfinance")
+
+HISTORY_COLUMNS = {"Open": "open", "High": "high", "Low": "low", "Close": "close", "Adj Close": "adj_close", "Volume": "volume"}
+HISTORY_FIELDS = ("open", "high", "low", "close", "adj_close", "volume")
+QUOTE_FAST_INFO_KEYS = ("currency", "lastPrice", "marketCap", "lastVolume", "open", "dayHigh", "dayLow")
 
 
 class YahooFinanceProvider(StockProvider):
@@ -46,10 +51,27 @@ class YahooFinanceProvider(StockProvider):
         "Depreciation And Amortization",
     ]
 
+    @staticmethod
+    def _fast_info_values(ticker, keys: tuple[str, ...]) -> dict:
+        # fast_info fetches lazily on key access, so resolve the keys inside the worker thread.
+        fast_info = ticker.fast_info
+        return {key: fast_info.get(key) for key in keys}
+
+    @classmethod
+    def _load_profile(cls, ticker) -> tuple[dict, dict]:
+        # One worker-thread hop for info plus the fast_info 52-week fallback when info lacks it.
+        info = ticker.info
+        year_range = {}
+        if not info.get("fiftyTwoWeekHigh") or not info.get("fiftyTwoWeekLow"):
+            year_range = cls._fast_info_values(ticker, ("yearHigh", "yearLow"))
+        return info, year_range
+
     async def get_quote(self, symbol: str) -> dict:
         ticker = yf.Ticker(symbol)
-        info = await asyncio.to_thread(lambda: ticker.fast_info)
-        raw_info = await asyncio.to_thread(lambda: ticker.info)
+        info, raw_info = await asyncio.gather(
+            asyncio.to_thread(self._fast_info_values, ticker, QUOTE_FAST_INFO_KEYS),
+            asyncio.to_thread(lambda: ticker.info),
+        )
         return {
             "symbol": symbol.upper(),
             "name": raw_info.get("shortName") or raw_info.get("longName") or symbol.upper(),
@@ -66,8 +88,7 @@ class YahooFinanceProvider(StockProvider):
 
     async def get_profile(self, symbol: str) -> dict:
         ticker = yf.Ticker(symbol)
-        fast_info = await asyncio.to_thread(lambda: ticker.fast_info)
-        info = await asyncio.to_thread(lambda: ticker.info)
+        info, year_range = await asyncio.to_thread(self._load_profile, ticker)
         return {
             "symbol": symbol.upper(),
             "name": info.get("longName") or info.get("shortName") or symbol.upper(),
@@ -97,8 +118,8 @@ class YahooFinanceProvider(StockProvider):
             "total_cash": info.get("totalCash"),
             "earnings_growth": info.get("earningsGrowth"),
             "shares_outstanding": info.get("sharesOutstanding"),
-            "week_52_high": info.get("fiftyTwoWeekHigh") or fast_info.get("yearHigh"),
-            "week_52_low": info.get("fiftyTwoWeekLow") or fast_info.get("yearLow"),
+            "week_52_high": info.get("fiftyTwoWeekHigh") or year_range.get("yearHigh"),
+            "week_52_low": info.get("fiftyTwoWeekLow") or year_range.get("yearLow"),
             "held_percent_insiders": info.get("heldPercentInsiders"),
             "held_percent_institutions": info.get("heldPercentInstitutions"),
             "shares_percent_shares_out": info.get("sharesPercentSharesOut"),
@@ -109,22 +130,14 @@ class YahooFinanceProvider(StockProvider):
         history = await asyncio.to_thread(
             lambda: ticker.history(period=period, interval="1d", auto_adjust=False)
         )
-        result = []
-        has_adj_close = "Adj Close" in history.columns
-        for idx, row in history.iterrows():
-            close_value = float(row["Close"])
-            result.append(
-                {
-                    "date": idx.strftime("%Y-%m-%d"),
-                    "open": float(row["Open"]),
-                    "high": float(row["High"]),
-                    "low": float(row["Low"]),
-                    "close": close_value,
-                    "adj_close": float(row["Adj Close"]) if has_adj_close else close_value,
-                    "volume": float(row["Volume"]),
-                }
-            )
-        return result
+        if history.empty:
+            return []
+        frame = history.rename(columns=HISTORY_COLUMNS)
+        if "adj_close" not in frame.columns:
+            frame = frame.assign(adj_close=frame["close"])
+        frame = frame[list(HISTORY_FIELDS)].astype("float64")
+        frame.insert(0, "date", history.index.strftime("%Y-%m-%d"))
+        return frame.to_dict(orient="records")
 
     async def search(self, query: str) -> list[dict]:
         searcher = yf.Search(query, max_results=8)
@@ -163,8 +176,10 @@ class YahooFinanceProvider(StockProvider):
 
     async def get_events(self, symbol: str, limit: int = 24) -> dict:
         ticker = yf.Ticker(symbol)
-        actions = await asyncio.to_thread(lambda: ticker.actions)
-        calendar = await asyncio.to_thread(lambda: ticker.calendar)
+        actions, calendar = await asyncio.gather(
+            asyncio.to_thread(lambda: ticker.actions),
+            asyncio.to_thread(lambda: ticker.calendar),
+        )
 
         items: list[dict] = []
         corporate_actions: list[dict] = []
@@ -5,11 +5,12 @@ from collections import defaultdict
 import math
 from typing import Any
 
-import yfinance as yf
-
 from app.core.cache import cache
 from app.services.stock_service import stock_service
 from app.services.universe_service import universe_service
+from app.utils.lazy_import import lazy_import
+
+yf = lazy_import("yfinance")
 
 
 class ScreenerService:
@@ -17,6 +18,7 @@ class ScreenerService:
     DEFAULT_SCAN_TIMEOUT_SECONDS = 12.0
     MAX_SCAN_TIMEOUT_SECONDS = 22.0
     EVALUATION_TIMEOUT_SECONDS = 5.0
+    EVALUATION_CONCURRENCY = 8
     INSIDER_SIGNAL_TIMEOUT_SECONDS = 2.5
     FINANCIALS_TIMEOUT_SECONDS = 2.8
     MAX_UNIVERSE_WITH_INSIDER = 120
@@ -869,7 +871,7 @@ class ScreenerService:
             has_custom_symbols=has_custom_symbols,
             insider_only=insider_only,
         )
-        semaphore = asyncio.Semaphore(8)
+        semaphore = asyncio.Semaphore(self.EVALUATION_CONCURRENCY)
         elimination_counts: dict[str, int] = defaultdict(int)
         elimination_lock = asyncio.Lock()
 
@@ -6,14 +6,18 @@ import re
 from datetime import datetime, timezone
 from typing import Any
 
-import httpx
-import yfinance as yf
-
 from app.core.cache import cache
 from app.core.config import settings
 from app.services.ai_service import ai_service
 from app.services.news_service import news_service
+from app.services.providers.alpha_vantage_provider import AlphaVantageProvider
 from app.services.stock_service import stock_service
+from app.utils.lazy_import import lazy_import
+
+yf = lazy_import("yfinance")
+
+# Transcript requests share the Alpha Vantage provider's request helper and concurrency cap.
+alpha_vantage_provider = AlphaVantageProvider()
 
 POSITIVE_TERMS = {
     "beat",
@@ -758,28 +762,11 @@ class SmartInsightsService:
         }
 
     async def _fetch_transcript(self, symbol: str, quarter: str) -> str:
-        if not settings.alpha_vantage_api_key:
-            return ""
-
-        params = {
-            "function": "EARNINGS_CALL_TRANSCRIPT",
-            "symbol": symbol.upper(),
-            "quarter": quarter,
-            "apikey": settings.alpha_vantage_api_key,
-        }
         try:
-            async with httpx.AsyncClient(timeout=20) as client:
-                response = await client.get("https://www.alphavantage.co/query", params=params)
-                response.raise_for_status()
-                payload = response.json()
+            return await alpha_vantage_provider.get_earnings_transcript(symbol, quarter)
         except Exception:
             return ""
 
-        transcript = payload.get("transcript")
-        if isinstance(transcript, str) and transcript.strip():
-            return transcript.strip()
-        return ""
-
     async def _earnings_call_summary(self, symbol: str, dashboard: dict, earnings_rows: list[dict]) -> dict:
         quarter_token = None
         if earnings_rows:
@@ -7,6 +7,7 @@ from typing import Any
 
 from fastapi import HTTPException
 
+from app.core.batching import TickBatcher
 from app.core.cache import cache
 from app.services.providers.alpha_vantage_provider import AlphaVantageProvider
 from app.services.providers.fmp_provider import FMPProvider
@@ -148,6 +149,7 @@ class StockService:
 
     def __init__(self) -> None:
         self.providers = [YahooFinanceProvider(), FMPProvider(), AlphaVantageProvider()]
+        self._quote_batcher = TickBatcher(self._quotes_batch)
 
     def _sanitize_json(self, value):
         if isinstance(value, dict):
@@ -618,19 +620,23 @@ class StockService:
         raise HTTPException(status_code=503, detail=f"Data providers unavailable: {detail}")
 
     async def _cached_provider_call_with_meta(self, cache_key: str, ttl_seconds: int, method_name: str, *args, **kwargs) -> tuple[Any, dict]:
-        cached = await cache.get(cache_key)
-        if isinstance(cached, dict) and "data" in cached and isinstance(cached.get("meta"), dict):
-            meta = dict(cached.get("meta") or {})
+        fetched = False
+
+        async def fetch() -> dict:
+            nonlocal fetched
+            fetched = True
+            wrapped = await self._from_providers_with_meta(method_name, *args, **kwargs)
+            meta = dict(wrapped.get("meta") or {})
+            meta["cache_status"] = "miss"
+            meta["cached_at"] = datetime.now(timezone.utc).isoformat()
+            return {"data": wrapped.get("data"), "meta": meta}
+
+        # remember() single-flights misses, so concurrent panels needing the same upstream call share one fetch.
+        payload = await cache.remember(cache_key, fetch, ttl_seconds=ttl_seconds)
+        meta = dict(payload.get("meta") or {})
+        if not fetched:
             meta["cache_status"] = "hit"
-            return cached.get("data"), meta
-
-        wrapped = await self._from_providers_with_meta(method_name, *args, **kwargs)
-        meta = dict(wrapped.get("meta") or {})
-        meta["cache_status"] = "miss"
-        meta["cached_at"] = datetime.now(timezone.utc).isoformat()
-        payload = {"data": wrapped.get("data"), "meta": meta}
-        await cache.set(cache_key, payload, ttl_seconds=ttl_seconds)
-        return wrapped.get("data"), meta
+        return payload.get("data"), meta
 
     def _panel_policy(self, panel: str) -> dict[str, int]:
         policy = self.PANEL_CACHE_POLICIES.get(panel, {"fresh_ttl_seconds": 120, "stale_ttl_seconds": 300})
@@ -2065,16 +2071,21 @@ class StockService:
             lambda: self._build_relevance_context(symbol, mode=normalized_mode, view=normalized_view),
         )
 
+    @staticmethod
+    def _provider_ready(provider) -> bool:
+        ready = getattr(provider, "_ready", None)
+        if callable(ready):
+            try:
+                return bool(ready())
+            except Exception:
+                pass
+        return True
+
     async def _from_providers(self, method_name: str, *args, **kwargs):
         errors: list[str] = []
         for provider in self.providers:
-            ready = getattr(provider, "_ready", None)
-            if callable(ready):
-                try:
-                    if not ready():
-                        continue
-                except Exception:
-                    pass
+            if not self._provider_ready(provider):
+                continue
             try:
                 method = getattr(provider, method_name)
                 return await method(*args, **kwargs)
@@ -2170,27 +2181,92 @@ class StockService:
         merged.sort(key=score)
         return self._sanitize_json(merged[:20])
 
+    async def _sanitized_provider_call(self, method_name: str, *args):
+        return self._sanitize_json(await self._from_providers(method_name, *args))
+
+    async def _sanitized_history(self, symbol: str, period: str) -> list[dict]:
+        data = await self._from_providers("get_history", symbol, period)
+        return self._sanitize_json(
+            [
+                row
+                for row in data
+                if isinstance(row, dict)
+                and self._is_finite_number(row.get("close"))
+                and self._is_finite_number(row.get("volume"))
+            ]
+        )
+
+    # Same fallback order as _from_providers, but each provider gets every symbol still missing in one call.
+    async def _quotes_batch(self, symbols: list[str]) -> dict[str, Any]:
+        results: dict[str, Any] = {}
+        errors: list[str] = []
+        remaining = list(symbols)
+        for provider in self.providers:
+            if not remaining:
+                break
+            if not self._provider_ready(provider):
+                continue
+            try:
+                batch = await provider.get_quotes(remaining)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pragma: no cover
+                errors.append(f"{provider.name}: {exc}")
+                continue
+            for symbol in remaining:
+                quote = batch.get(symbol)
+                if isinstance(quote, dict) and quote:
+                    results[symbol] = self._sanitize_json(quote)
+                elif isinstance(quote, BaseException):
+                    errors.append(f"{provider.name}: {quote}")
+            remaining = [symbol for symbol in remaining if symbol not in results]
+
+        detail = errors[0] if errors else "No configured providers are available."
+        for symbol in remaining:
+            results[symbol] = HTTPException(status_code=503, detail=f"Data providers unavailable: {detail}")
+        return results
+
+    # Payloads are sanitized before they are cached, so cache hits are returned as stored.
+    # Concurrent quote cache misses are coalesced into one _quotes_batch call per loop tick,
+    # which providers with a multi-symbol endpoint (FMP) serve in a single request.
     async def quote(self, symbol: str) -> dict:
-        key = f"quote:{symbol.upper()}"
-        data = await cache.remember(key, lambda: self._from_providers("get_quote", symbol), ttl_seconds=60)
-        return self._sanitize_json(data)
+        normalized = symbol.upper()
+        key = f"quote:{normalized}"
+        return await cache.remember(key, lambda: self._quote_batcher.load(normalized), ttl_seconds=60)
 
     async def profile(self, symbol: str) -> dict:
         key = f"profile:{symbol.upper()}"
-        data = await cache.remember(key, lambda: self._from_providers("get_profile", symbol), ttl_seconds=900)
-        return self._sanitize_json(data)
+        return await cache.remember(key, lambda: self._sanitized_provider_call("get_profile", symbol), ttl_seconds=900)
 
     async def history(self, symbol: str, period: str = "6mo") -> list[dict]:
         key = f"history:{symbol.upper()}:{period}"
-        data = await cache.remember(key, lambda: self._from_providers("get_history", symbol, period), ttl_seconds=300)
-        safe_history = [
-            row
-            for row in data
-            if isinstance(row, dict)
-            and self._is_finite_number(row.get("close"))
-            and self._is_finite_number(row.get("volume"))
-        ]
-        return self._sanitize_json(safe_history)
+        return await cache.remember(key, lambda: self._sanitized_history(symbol, period), ttl_seconds=300)
+
+    # Same cache keys as the single-symbol methods, but read with one MGET and written back in one pipeline.
+    async def _remember_per_symbol(self, symbols: list[str], key_prefix: str, key_suffix: str, fetch, ttl_seconds: int) -> dict[str, Any]:
+        unique = list(dict.fromkeys(str(symbol).upper() for symbol in symbols if symbol))
+        symbol_by_key = {f"{key_prefix}:{symbol}{key_suffix}": symbol for symbol in unique}
+
+        async def produce(keys: list[str]) -> dict[str, Any]:
+            results = await asyncio.gather(*(fetch(symbol_by_key[key]) for key in keys), return_exceptions=True)
+            return {key: result for key, result in zip(keys, results) if not isinstance(result, BaseException)}
+
+        found = await cache.remember_many(list(symbol_by_key), produce, ttl_seconds=ttl_seconds)
+        return {symbol_by_key[key]: value for key, value in found.items()}
+
+    # Batch helpers: deduplicate symbols, fetch concurrently, and omit symbols whose lookup failed.
+    async def quotes(self, symbols: list[str]) -> dict[str, dict]:
+        return await self._remember_per_symbol(symbols, "quote", "", self._quote_batcher.load, 60)
+
+    async def profiles(self, symbols: list[str]) -> dict[str, dict]:
+        return await self._remember_per_symbol(
+            symbols, "profile", "", lambda symbol: self._sanitized_provider_call("get_profile", symbol), 900
+        )
+
+    async def histories(self, symbols: list[str], period: str = "6mo") -> dict[str, list[dict]]:
+        return await self._remember_per_symbol(
+            symbols, "history", f":{period}", lambda symbol: self._sanitized_history(symbol, period), 300
+        )
 
     async def financial_statements(self, symbol: str, years: int = 10) -> dict:
         key = f"financials:{symbol.upper()}:{years}"
@@ -5,7 +5,7 @@ import csv
 from datetime import datetime, timedelta
 from typing import Optional
 
-import httpx
+from app.core.http import get_http_client
 
 FALLBACK_UNIVERSE = [
     {"symbol": "AAPL", "name": "Apple Inc.", "exchange": "NASDAQ"},
@@ -51,10 +51,9 @@ class UniverseService:
         self._lock = asyncio.Lock()
 
     async def _download_text(self, url: str) -> str:
-        async with httpx.AsyncClient(timeout=25, follow_redirects=True) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.text
+        response = await get_http_client().get(url, timeout=25, follow_redirects=True)
+        response.raise_for_status()
+        return response.text
 
     @staticmethod
     def _parse_csv_rows(text: str) -> list[dict[str, str]]:
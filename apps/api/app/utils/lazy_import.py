@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+
+
+class _LazyModule(ModuleType):
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self._lazy_lock = threading.Lock()
+
+    def __getattr__(self, attr: str):
+        # Only reached for names not yet copied in; the lock makes the first touch safe from worker threads
+        # (importlib.util.LazyLoader races there before Python 3.12.3).
+        with self._lazy_lock:
+            module = importlib.import_module(self.__name__)
+            self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+# Returns a module whose real import runs on first attribute access, keeping heavy
+# libraries (yfinance pulls in pandas/numpy) out of process startup.
+def lazy_import(name: str) -> ModuleType:
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    return _LazyModule(name)
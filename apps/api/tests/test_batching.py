@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.core.batching import TickBatcher
+
+
+async def test_loads_in_one_tick_share_one_batch():
+    batches: list[list[str]] = []
+
+    async def batch_fn(keys):
+        batches.append(keys)
+        return {key: key.lower() for key in keys}
+
+    batcher = TickBatcher(batch_fn)
+    results = await asyncio.gather(batcher.load("A"), batcher.load("B"), batcher.load("C"))
+
+    assert results == ["a", "b", "c"]
+    assert batches == [["A", "B", "C"]]
+
+
+async def test_duplicate_keys_are_fetched_once():
+    batches: list[list[str]] = []
+
+    async def batch_fn(keys):
+        batches.append(keys)
+        return {key: key.lower() for key in keys}
+
+    batcher = TickBatcher(batch_fn)
+    results = await asyncio.gather(batcher.load("A"), batcher.load("A"), batcher.load("B"))
+
+    assert results == ["a", "a", "b"]
+    assert batches == [["A", "B"]]
+
+
+async def test_missing_key_raises_key_error():
+    async def batch_fn(keys):
+        return {"A": "a"}
+
+    batcher = TickBatcher(batch_fn)
+    found, missing = await asyncio.gather(batcher.load("A"), batcher.load("B"), return_exceptions=True)
+
+    assert found == "a"
+    assert isinstance(missing, KeyError)
+
+
+async def test_per_key_exception_fails_only_that_key():
+    async def batch_fn(keys):
+        return {"A": "a", "B": ValueError("bad symbol")}
+
+    batcher = TickBatcher(batch_fn)
+    found, failed = await asyncio.gather(batcher.load("A"), batcher.load("B"), return_exceptions=True)
+
+    assert found == "a"
+    assert isinstance(failed, ValueError)
+
+
+async def test_batch_failure_fails_every_load():
+    async def batch_fn(keys):
+        raise RuntimeError("upstream down")
+
+    batcher = TickBatcher(batch_fn)
+    results = await asyncio.gather(batcher.load("A"), batcher.load("B"), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_cancelled_batch_does_not_hang_loads():
+    async def batch_fn(keys):
+        raise asyncio.CancelledError
+
+    batcher = TickBatcher(batch_fn)
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(batcher.load("A"), 1)
+
+
+async def test_cancelled_dispatch_task_does_not_hang_loads():
+    started = asyncio.Event()
+
+    async def batch_fn(keys):
+        started.set()
+        await asyncio.sleep(10)
+        return {}
+
+    batcher = TickBatcher(batch_fn)
+    load = asyncio.create_task(batcher.load("A"))
+    await started.wait()
+    for task in list(batcher._tasks):
+        task.cancel()
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(load, 1)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+
+from app.core.cache import CacheClient
+
+
+async def test_remember_single_flights_concurrent_misses():
+    cache = CacheClient()
+    calls = 0
+
+    async def producer():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": calls}
+
+    results = await asyncio.gather(*(cache.remember("k", producer) for _ in range(5)))
+
+    assert calls == 1
+    assert results == [{"value": 1}] * 5
+
+
+async def test_cancelled_leader_lets_follower_finish():
+    cache = CacheClient()
+    started = asyncio.Event()
+    calls = 0
+
+    async def producer():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await asyncio.sleep(10)
+        return {"value": calls}
+
+    leader = asyncio.create_task(cache.remember("k", producer))
+    await started.wait()
+    follower = asyncio.create_task(cache.remember("k", producer))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await asyncio.wait_for(follower, 1) == {"value": 2}
+    assert leader.cancelled()
+    assert await cache.get("k") == {"value": 2}
+
+
+async def test_cancelled_follower_does_not_cancel_leader():
+    cache = CacheClient()
+    release = asyncio.Event()
+
+    async def producer():
+        await release.wait()
+        return {"value": 1}
+
+    leader = asyncio.create_task(cache.remember("k", producer))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.remember("k", producer))
+    await asyncio.sleep(0)
+    follower.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.wait_for(leader, 1) == {"value": 1}
+    assert follower.cancelled()
+
+
+async def test_leader_failure_propagates_to_followers():
+    cache = CacheClient()
+    release = asyncio.Event()
+
+    async def producer():
+        await release.wait()
+        raise RuntimeError("upstream down")
+
+    tasks = [asyncio.create_task(cache.remember("k", producer)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert await cache.get("k") is None
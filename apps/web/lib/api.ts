@@ -225,5 +225,5 @@ export const api = {
       token
     ),
   deleteAlert: (alertId: string, token: string) => call<{ ok: boolean }>(`/alerts/${alertId}`, { method: "DELETE" }, token),
-  checkAlerts: (token: string) => call<{ triggered: Array<Record<string, unknown>>; count: number }>("/alerts/check", { method: "POST" }, token)
+  checkAlerts: (token: string) => call<{ triggered: Array<Record<string, unknown>>; count: number; errors: Array<{ symbol: string; error: string }> }>("/alerts/check", { method: "POST" }, token)
 };
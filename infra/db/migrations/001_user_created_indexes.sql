@@ -0,0 +1,5 @@
+-- Composite indexes backing the per-user list endpoints, which filter on user_id and order by created_at.
+-- Table creation via metadata.create_all does not add indexes to tables that already exist, so run this once on existing databases.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_watchlists_user_created ON watchlists(user_id, created_at);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_portfolios_user_created ON portfolios(user_id, created_at);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_alerts_user_created ON alerts(user_id, created_at);
@@ -0,0 +1,27 @@
+-- Convert VARCHAR(36) primary and foreign keys to native UUID (16 bytes instead of 37).
+-- Foreign keys are dropped first so referencing and referenced columns can change type together.
+BEGIN;
+
+ALTER TABLE watchlists DROP CONSTRAINT IF EXISTS watchlists_user_id_fkey;
+ALTER TABLE watchlist_items DROP CONSTRAINT IF EXISTS watchlist_items_watchlist_id_fkey;
+ALTER TABLE portfolios DROP CONSTRAINT IF EXISTS portfolios_user_id_fkey;
+ALTER TABLE portfolio_positions DROP CONSTRAINT IF EXISTS portfolio_positions_portfolio_id_fkey;
+ALTER TABLE portfolio_transactions DROP CONSTRAINT IF EXISTS portfolio_transactions_portfolio_id_fkey;
+ALTER TABLE alerts DROP CONSTRAINT IF EXISTS alerts_user_id_fkey;
+
+ALTER TABLE users ALTER COLUMN id TYPE UUID USING id::uuid;
+ALTER TABLE watchlists ALTER COLUMN id TYPE UUID USING id::uuid, ALTER COLUMN user_id TYPE UUID USING user_id::uuid;
+ALTER TABLE watchlist_items ALTER COLUMN id TYPE UUID USING id::uuid, ALTER COLUMN watchlist_id TYPE UUID USING watchlist_id::uuid;
+ALTER TABLE portfolios ALTER COLUMN id TYPE UUID USING id::uuid, ALTER COLUMN user_id TYPE UUID USING user_id::uuid;
+ALTER TABLE portfolio_positions ALTER COLUMN id TYPE UUID USING id::uuid, ALTER COLUMN portfolio_id TYPE UUID USING portfolio_id::uuid;
+ALTER TABLE portfolio_transactions ALTER COLUMN id TYPE UUID USING id::uuid, ALTER COLUMN portfolio_id TYPE UUID USING portfolio_id::uuid;
+ALTER TABLE alerts ALTER COLUMN id TYPE UUID USING id::uuid, ALTER COLUMN user_id TYPE UUID USING user_id::uuid;
+
+ALTER TABLE watchlists ADD CONSTRAINT watchlists_user_id_fkey FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE;
+ALTER TABLE watchlist_items ADD CONSTRAINT watchlist_items_watchlist_id_fkey FOREIGN KEY (watchlist_id) REFERENCES watchlists(id) ON DELETE CASCADE;
+ALTER TABLE portfolios ADD CONSTRAINT portfolios_user_id_fkey FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE;
+ALTER TABLE portfolio_positions ADD CONSTRAINT portfolio_positions_portfolio_id_fkey FOREIGN KEY (portfolio_id) REFERENCES portfolios(id) ON DELETE CASCADE;
+ALTER TABLE portfolio_transactions ADD CONSTRAINT portfolio_transactions_portfolio_id_fkey FOREIGN KEY (portfolio_id) REFERENCES portfolios(id) ON DELETE CASCADE;
+ALTER TABLE alerts ADD CONSTRAINT alerts_user_id_fkey FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE;
+
+COMMIT;
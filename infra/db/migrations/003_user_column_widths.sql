@@ -0,0 +1,11 @@
+-- bcrypt hashes are 60 characters and Google subject ids are at most 21 digits.
+-- The inline UNIQUE on google_sub is replaced by a partial unique index so the many NULLs of
+-- email/password users stay out of it.
+BEGIN;
+
+ALTER TABLE users ALTER COLUMN password_hash TYPE VARCHAR(72);
+ALTER TABLE users ALTER COLUMN google_sub TYPE VARCHAR(32);
+ALTER TABLE users DROP CONSTRAINT IF EXISTS users_google_sub_key;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_users_google_sub ON users(google_sub) WHERE google_sub IS NOT NULL;
+
+COMMIT;
@@ -0,0 +1,5 @@
+-- Case-insensitive email uniqueness: one unique index on lower(email) replaces the exact-case one.
+-- Fails if existing rows differ only by email case (merge those accounts first).
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_users_email_lower ON users (lower(email));
+ALTER TABLE users DROP CONSTRAINT IF EXISTS users_email_key;
+DROP INDEX IF EXISTS ix_users_email;